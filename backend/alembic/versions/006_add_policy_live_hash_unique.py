@@ -0,0 +1,33 @@
+"""Add partial unique index on live policy file hashes
+
+Revision ID: 006_add_policy_live_hash_unique
+Revises: 004_add_policy_versions
+Create Date: 2026-10-15 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_policy_live_hash_unique"
+down_revision: Union[str, None] = "004_add_policy_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # At most one live (not soft-deleted) policy per content hash
+    op.create_index(
+        'ux_policy_live_hash',
+        'policies',
+        ['file_hash'],
+        unique=True,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+        sqlite_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_policy_live_hash', table_name='policies')
@@ -0,0 +1,30 @@
+"""Add keyset pagination index for policy listings
+
+Revision ID: 007_add_policy_list_keyset_index
+Revises: 006_add_policy_live_hash_unique
+Create Date: 2026-10-15 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_add_policy_list_keyset_index"
+down_revision: Union[str, None] = "006_add_policy_live_hash_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seek on (created_at, id) among live rows instead of OFFSET scans
+    op.create_index(
+        'idx_policy_list_keyset',
+        'policies',
+        ['deleted_at', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_policy_list_keyset', table_name='policies')
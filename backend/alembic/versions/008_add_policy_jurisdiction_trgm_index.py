@@ -0,0 +1,37 @@
+"""Add trigram index for jurisdiction substring filters
+
+Revision ID: 008_add_policy_jurisdiction_trgm_index
+Revises: 007_add_policy_list_keyset_index
+Create Date: 2026-10-15 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_add_policy_jurisdiction_trgm_index"
+down_revision: Union[str, None] = "007_add_policy_list_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; SQLite keeps the plain B-tree index
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Lets ILIKE '%term%' use an index instead of a sequential scan
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_policy_jurisdiction_trgm',
+        'policies',
+        ['jurisdiction'],
+        postgresql_using='gin',
+        postgresql_ops={'jurisdiction': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('idx_policy_jurisdiction_trgm', table_name='policies')
@@ -0,0 +1,35 @@
+"""Add partial indexes for filtered policy listings
+
+Revision ID: 009_add_policy_live_filter_indexes
+Revises: 008_add_policy_jurisdiction_trgm_index
+Create Date: 2026-10-15 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_add_policy_live_filter_indexes"
+down_revision: Union[str, None] = "008_add_policy_jurisdiction_trgm_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status/type-filtered listings read rows and window total from one
+    # ordered scan over live rows only
+    for column in ('status', 'policy_type'):
+        op.create_index(
+            f'idx_policy_live_{column}_created',
+            'policies',
+            [column, sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            sqlite_where=sa.text("deleted_at IS NULL"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_policy_live_policy_type_created', table_name='policies')
+    op.drop_index('idx_policy_live_status_created', table_name='policies')
@@ -0,0 +1,26 @@
+"""Drop the standalone policies.created_at index
+
+Revision ID: 010_drop_policy_created_at_index
+Revises: 009_add_policy_live_filter_indexes
+Create Date: 2026-10-15 16:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_drop_policy_created_at_index"
+down_revision: Union[str, None] = "009_add_policy_live_filter_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every created_at-ordered listing is limited to live rows and served by
+    # idx_policy_list_keyset or the partial status/type indexes
+    op.drop_index('idx_policy_created_at', table_name='policies', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('idx_policy_created_at', 'policies', ['created_at'])
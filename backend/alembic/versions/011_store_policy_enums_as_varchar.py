@@ -0,0 +1,94 @@
+"""Store policy enum columns as VARCHAR values with CHECK constraints
+
+Revision ID: 011_store_policy_enums_as_varchar
+Revises: 010_drop_policy_created_at_index
+Create Date: 2026-10-15 15:00:00.000000
+
+On SQLite the columns are already VARCHAR and only their values are
+rewritten. Adding the CHECK constraints there would need a table rebuild,
+so SQLite databases migrated through this revision have no CHECK
+constraints, while tables created fresh from the models do.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_store_policy_enums_as_varchar"
+down_revision: Union[str, None] = "010_drop_policy_created_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, native enum type, check constraint, allowed values)
+ENUM_COLUMNS = (
+    ('policies', 'policy_type', 'policytype', 'ck_policy_type', (
+        'healthcare', 'education', 'agriculture', 'employment', 'housing',
+        'social_welfare', 'infrastructure', 'environment', 'finance', 'other',
+    )),
+    ('policies', 'status', 'policystatus', 'ck_policy_status', (
+        'uploaded', 'processing', 'analyzed', 'failed', 'archived',
+    )),
+    ('policy_processing', 'stage', 'processingstage', 'ck_processing_stage', (
+        'text_extraction', 'chunking', 'summarization', 'embedding', 'qa_ready',
+    )),
+    ('policy_processing', 'status', 'processingstatus', 'ck_processing_status', (
+        'pending', 'in_progress', 'completed', 'failed',
+    )),
+)
+# policy_versions was created with plain string columns holding member names
+VERSION_COLUMNS = (
+    ('policy_versions', 'policy_type', 'ck_policy_version_type', ENUM_COLUMNS[0][4]),
+    ('policy_versions', 'status', 'ck_policy_version_status', ENUM_COLUMNS[1][4]),
+)
+
+
+def _check(column: str, values: Sequence[str]) -> str:
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    # Member names were stored until now; every value is its name lower-cased
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite already stores these as VARCHAR; see the module docstring
+        # for why no CHECK constraints are added here
+        for table, column, _, _, _ in ENUM_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = lower({column})")
+        for table, column, _, _ in VERSION_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = lower({column})")
+        return
+
+    for table, column, _, constraint, values in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) "
+            f"USING lower({column}::text)"
+        )
+        op.create_check_constraint(constraint, table, _check(column, values))
+    for table, column, constraint, values in VERSION_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = lower({column})")
+        op.create_check_constraint(constraint, table, _check(column, values))
+    for _, _, type_name, _, _ in ENUM_COLUMNS:
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for table, column, _, _, _ in ENUM_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = upper({column})")
+        for table, column, _, _ in VERSION_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = upper({column})")
+        return
+
+    for table, column, constraint, _ in VERSION_COLUMNS:
+        op.drop_constraint(constraint, table, type_='check')
+        op.execute(f"UPDATE {table} SET {column} = upper({column})")
+    for table, column, type_name, constraint, values in ENUM_COLUMNS:
+        op.drop_constraint(constraint, table, type_='check')
+        op.execute(
+            f"CREATE TYPE {type_name} AS ENUM "
+            f"({', '.join(repr(v.upper()) for v in values)})"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING upper({column})::{type_name}"
+        )
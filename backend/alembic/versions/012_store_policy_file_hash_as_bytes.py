@@ -0,0 +1,51 @@
+"""Store policies.file_hash as a raw digest
+
+Revision ID: 012_store_policy_file_hash_as_bytes
+Revises: 011_store_policy_enums_as_varchar
+Create Date: 2026-10-15 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_store_policy_file_hash_as_bytes"
+down_revision: Union[str, None] = "011_store_policy_enums_as_varchar"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Indexes on the column are rebuilt with the 32-byte keys
+        op.execute(
+            "ALTER TABLE policies ALTER COLUMN file_hash TYPE BYTEA "
+            "USING decode(file_hash, 'hex')"
+        )
+        return
+
+    # SQLite columns are untyped; rewrite the hex text as blobs in place
+    rows = bind.execute(sa.text(
+        "SELECT id, file_hash FROM policies WHERE file_hash IS NOT NULL"
+    )).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE policies SET file_hash = :digest WHERE id = :id"),
+            [{"id": row.id, "digest": bytes.fromhex(row.file_hash)} for row in rows],
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE policies ALTER COLUMN file_hash TYPE VARCHAR(64) "
+            "USING encode(file_hash, 'hex')"
+        )
+        return
+    op.execute(
+        "UPDATE policies SET file_hash = lower(hex(file_hash)) "
+        "WHERE file_hash IS NOT NULL"
+    )
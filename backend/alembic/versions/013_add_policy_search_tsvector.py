@@ -0,0 +1,46 @@
+"""Generate policies.search_vector as a tsvector with a GIN index
+
+Revision ID: 013_add_policy_search_tsvector
+Revises: 012_store_policy_file_hash_as_bytes
+Create Date: 2026-10-15 17:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision: str = "013_add_policy_search_tsvector"
+down_revision: Union[str, None] = "012_store_policy_file_hash_as_bytes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+
+def upgrade() -> None:
+    # tsvector is PostgreSQL-only; SQLite keeps the plain text column
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # The placeholder text column was never populated
+    op.drop_column('policies', 'search_vector')
+    op.add_column(
+        'policies',
+        sa.Column('search_vector', TSVECTOR, sa.Computed(SEARCH_DOCUMENT, persisted=True)),
+    )
+    op.create_index(
+        'idx_policy_search_vector',
+        'policies',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('idx_policy_search_vector', table_name='policies')
+    op.drop_column('policies', 'search_vector')
+    op.add_column('policies', sa.Column('search_vector', sa.Text(), nullable=True))
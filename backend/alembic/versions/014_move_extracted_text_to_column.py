@@ -0,0 +1,53 @@
+"""Move extracted text out of policy_processing.result_data into its own column
+
+Revision ID: 014_move_extracted_text_to_column
+Revises: 013_add_policy_search_tsvector
+Create Date: 2026-10-15 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_move_extracted_text_to_column"
+down_revision: Union[str, None] = "013_add_policy_search_tsvector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('policy_processing', sa.Column('extracted_text', sa.Text(), nullable=True))
+
+    # Copy the text over, then drop it from the JSON so only metadata remains
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE policy_processing SET "
+            "extracted_text = result_data->>'extracted_text', "
+            "result_data = (result_data::jsonb - 'extracted_text')::json "
+            "WHERE stage = 'text_extraction' AND result_data IS NOT NULL"
+        )
+    else:
+        op.execute(
+            "UPDATE policy_processing SET "
+            "extracted_text = json_extract(result_data, '$.extracted_text'), "
+            "result_data = json_remove(result_data, '$.extracted_text') "
+            "WHERE stage = 'text_extraction' AND result_data IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE policy_processing SET result_data = "
+            "jsonb_set(result_data::jsonb, '{extracted_text}', to_jsonb(extracted_text))::json "
+            "WHERE extracted_text IS NOT NULL AND result_data IS NOT NULL"
+        )
+    else:
+        op.execute(
+            "UPDATE policy_processing SET result_data = "
+            "json_set(result_data, '$.extracted_text', extracted_text) "
+            "WHERE extracted_text IS NOT NULL AND result_data IS NOT NULL"
+        )
+    op.drop_column('policy_processing', 'extracted_text')
@@ -0,0 +1,35 @@
+"""Replace the plain policies.file_hash index with one on soft-deleted rows
+
+Revision ID: 015_replace_policy_file_hash_index
+Revises: 014_move_extracted_text_to_column
+Create Date: 2026-10-15 19:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_replace_policy_file_hash_index"
+down_revision: Union[str, None] = "014_move_extracted_text_to_column"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Live rows are already indexed by ux_policy_live_hash; cover only the
+    # soft-deleted ones, so each insert maintains a single hash index
+    op.create_index(
+        'idx_policy_deleted_hash',
+        'policies',
+        ['file_hash'],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        sqlite_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.drop_index('ix_policies_file_hash', table_name='policies', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_policies_file_hash', 'policies', ['file_hash'])
+    op.drop_index('idx_policy_deleted_hash', table_name='policies')
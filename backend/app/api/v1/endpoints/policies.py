@@ -3,12 +3,22 @@ Policy endpoints for document upload and management.
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, func, bindparam, tuple_, DateTime, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+import asyncio
 import logging
+import os
+
+import orjson
+from cachetools import LRUCache
 
 from app.schemas.policy import (
     PolicyUploadResponse, 
@@ -20,30 +30,42 @@ from app.schemas.policy import (
     PolicyVersionPublic,
     PolicyVersionListResponse,
     TextExtractionResponse,
-    ExtractedTextResponse
+    ExtractedTextResponse,
+    from_orm_fast
 )
 from app.models.policy import Policy, PolicyStatus
 from app.core.dependencies import get_db
+from app.core.database import AsyncSessionLocal, sql_utcnow
 from app.constants import (
     POLICY_UPLOAD_DIR,
     MAX_FILE_SIZE_BYTES,
+    MAX_CONCURRENT_UPLOADS,
+    UPLOAD_SLOT_TIMEOUT_SECONDS,
+    ERROR_TOO_MANY_UPLOADS,
     ERROR_POLICY_NOT_FOUND,
     ERROR_POLICY_ALREADY_EXISTS,
+    ERROR_POLICY_FILE_MISSING,
     DEFAULT_PAGE_LIMIT,
     MAX_PAGE_LIMIT,
+    MAX_PAGE_OFFSET,
+    MAX_STREAM_LIMIT,
+    POLICY_RESPONSE_CACHE_SIZE,
+    JURISDICTION_SUBSTRING_MIN_LENGTH,
     SUCCESS_TEXT_EXTRACTION_STARTED,
     ERROR_NO_EXTRACTED_TEXT,
 )
+from app.utils.response_utils import encode_cursor, decode_cursor
 from app.utils.file_utils import (
     validate_pdf,
-    validate_file_size,
-    calculate_file_hash,
+    fingerprint_upload,
+    save_upload_file,
+    remove_file,
     generate_unique_id,
     sanitize_filename,
 )
 from app.services.text_extraction import (
     process_policy_text_extraction,
-    get_extracted_text,
+    get_extracted_text_record,
     TextExtractionError
 )
 from app.services.policy_version_service import (
@@ -62,6 +84,210 @@ router = APIRouter()
 POLICY_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Statements built once and reused across requests; per-request values
+# are supplied as bound parameters at execution time
+_SELECT_LIVE_POLICY = select(Policy).where(
+    Policy.policy_id == bindparam("policy_id"),
+    Policy.deleted_at.is_(None)
+)
+_SELECT_LIVE_POLICY_UPDATED_AT = select(Policy.updated_at).where(
+    Policy.policy_id == bindparam("policy_id"),
+    Policy.deleted_at.is_(None)
+)
+_SELECT_LIVE_POLICY_FILE = select(Policy.file_path, Policy.filename, Policy.content_type).where(
+    Policy.policy_id == bindparam("policy_id"),
+    Policy.deleted_at.is_(None)
+)
+_SOFT_DELETE_LIVE_POLICY = (
+    update(Policy)
+    .where(Policy.policy_id == bindparam("target_policy_id"), Policy.deleted_at.is_(None))
+    .values(deleted_at=sql_utcnow())  # updated_at is stamped by its onupdate
+    .execution_options(synchronize_session=False)
+)
+
+
+# Caps the uploads hashed and written at once, bounding disk I/O and
+# memory however many clients upload together
+_upload_sem = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+
+# Serialized get_policy bodies keyed by (policy_id, updated_at). Any write
+# bumps updated_at, so stale entries are never matched and simply age out.
+_policy_response_cache: LRUCache = LRUCache(maxsize=POLICY_RESPONSE_CACHE_SIZE)
+
+
+# PolicyPublic's fields, serialized straight from rows by the listings
+_POLICY_PUBLIC_FIELDS = tuple(PolicyPublic.model_fields)
+
+
+@lru_cache(maxsize=32)
+def _list_policies_queries(
+    by_status: bool,
+    by_type: bool,
+    by_jurisdiction: bool,
+    by_cursor: bool = False
+):
+    """
+    Build the page, count and stream queries for a combination of list filters.
+    
+    The offset page query carries the filtered total as a window column, so
+    a single statement returns both. The separate count query is only needed
+    when the requested page is past the end and returns no rows. Cursor pages
+    report no total, so their query has no window to evaluate over every
+    remaining row and can stop as soon as the page is filled. The stream
+    query selects only the public columns, without the window total, so rows
+    can be sent as soon as the database produces them.
+    
+    Args:
+        by_status: Whether a status filter is applied
+        by_type: Whether a policy type filter is applied
+        by_jurisdiction: Whether a jurisdiction filter is applied
+        by_cursor: Whether the page starts after a keyset cursor
+        
+    Returns:
+        Tuple of (page query, count query, stream query)
+    """
+    conditions = [Policy.deleted_at.is_(None)]
+    if by_status:
+        conditions.append(Policy.status == bindparam("status"))
+    if by_type:
+        conditions.append(Policy.policy_type == bindparam("policy_type"))
+    if by_jurisdiction:
+        conditions.append(Policy.jurisdiction.ilike(bindparam("jurisdiction")))
+    count_query = select(func.count(Policy.id)).where(*conditions)
+    
+    if by_cursor:
+        # Seek past the cursor instead of scanning and discarding OFFSET rows
+        conditions.append(
+            tuple_(Policy.created_at, Policy.id) < tuple_(
+                bindparam("cursor_created_at", type_=DateTime),
+                bindparam("cursor_id", type_=Integer)
+            )
+        )
+    
+    if by_cursor:
+        page_query = (
+            select(Policy)
+            .where(*conditions)
+            .order_by(Policy.created_at.desc(), Policy.id.desc())
+            .limit(bindparam("limit"))
+        )
+    else:
+        page_query = (
+            select(Policy, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(Policy.created_at.desc(), Policy.id.desc())
+            .limit(bindparam("limit"))
+            .offset(bindparam("offset"))
+        )
+    stream_query = (
+        select(*(getattr(Policy, field) for field in _POLICY_PUBLIC_FIELDS))
+        .where(*conditions)
+        .order_by(Policy.created_at.desc(), Policy.id.desc())
+        .limit(bindparam("limit"))
+    )
+    return page_query, count_query, stream_query
+
+
+def _list_policies_params(
+    status_filter: Optional[PolicyStatusEnum],
+    policy_type: Optional[PolicyTypeEnum],
+    jurisdiction: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str]
+) -> dict:
+    """
+    Bind the list query parameters for the given filters and page position.
+    
+    Raises:
+        HTTPException: If the cursor cannot be decoded
+    """
+    params = {"limit": limit, "offset": offset}
+    if status_filter:
+        params["status"] = status_filter.value
+    if policy_type:
+        params["policy_type"] = policy_type.value
+    if jurisdiction:
+        # Trigram indexes need at least 3 characters to narrow a substring
+        # search; shorter values (e.g. "CA") match the whole jurisdiction
+        if len(jurisdiction) >= JURISDICTION_SUBSTRING_MIN_LENGTH:
+            params["jurisdiction"] = f"%{jurisdiction}%"
+        else:
+            params["jurisdiction"] = jurisdiction
+    if cursor is not None:
+        try:
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        params["offset"] = 0
+    return params
+
+
+def _encode_policy_list(
+    policies: List[Policy],
+    total: Optional[int],
+    limit: int,
+    offset: int,
+    next_cursor: Optional[str]
+) -> bytes:
+    """
+    Serialize a policy list page straight to PolicyListResponse JSON.
+    
+    Rows go to orjson as plain dicts of PolicyPublic's fields, skipping
+    model construction and FastAPI's response_model round trip (dump,
+    re-validate, serialize). Only for rows read from our own database;
+    the response_model is kept for the OpenAPI schema.
+    
+    Args:
+        policies: Policy ORM instances for the page
+        total: Total matching policies, or None for cursor pages
+        limit: Page size requested
+        offset: Offset applied
+        next_cursor: Cursor for the next page, if any
+        
+    Returns:
+        bytes: JSON body
+    """
+    return orjson.dumps(
+        {
+            "policies": [
+                {field: getattr(policy, field) for field in _POLICY_PUBLIC_FIELDS}
+                for policy in policies
+            ],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        },
+        # Match Pydantic's rendering of UTC timestamps
+        option=orjson.OPT_UTC_Z
+    )
+
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT ... RETURNING
+_INSERT_BY_DIALECT = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+async def _acquire_upload_slot() -> None:
+    """
+    Wait briefly for an upload slot.
+    
+    Raises:
+        HTTPException: 503 with Retry-After if no slot frees up in time
+    """
+    try:
+        await asyncio.wait_for(_upload_sem.acquire(), timeout=UPLOAD_SLOT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Upload rejected: all upload slots are busy")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=ERROR_TOO_MANY_UPLOADS,
+            headers={"Retry-After": str(UPLOAD_SLOT_TIMEOUT_SECONDS)}
+        )
 
 
 @router.post(
@@ -101,80 +327,89 @@ async def upload_policy(
     stored_filename = f"{policy_id}{file_ext}"
     file_path = POLICY_UPLOAD_DIR / stored_filename
     
+    await _acquire_upload_slot()
     try:
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
-        logger.debug(f"File read successfully: {file_size} bytes")
+        # Size-check and hash the spooled upload; nothing is written to the
+        # upload directory until the duplicate check has passed
+        file_size, file_hash = await fingerprint_upload(file, MAX_FILE_SIZE_BYTES)
         
-        # Validate file size
-        validate_file_size(file_size, MAX_FILE_SIZE_BYTES)
-        
-        # Calculate file hash
-        file_hash = calculate_file_hash(content)
-        
-        # Check for duplicate files
-        stmt = select(Policy).where(Policy.file_hash == file_hash, Policy.deleted_at.is_(None))
-        result = await db.execute(stmt)
-        existing_policy = result.scalar_one_or_none()
+        # Insert the record; the live-hash unique index rejects duplicates
+        # in the same round trip instead of a separate SELECT beforehand
+        insert = _INSERT_BY_DIALECT[db.get_bind().dialect.name]
+        stmt = (
+            insert(Policy)
+            .values(
+                policy_id=policy_id,
+                filename=file.filename,
+                file_path=str(file_path),
+                file_size=file_size,
+                file_hash=file_hash,
+                content_type=file.content_type,
+                status=PolicyStatus.UPLOADED
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Policy.file_hash],
+                index_where=Policy.deleted_at.is_(None)
+            )
+            .returning(Policy.id, Policy.created_at)
+        )
+        inserted = (await db.execute(stmt)).first()
         
-        if existing_policy:
+        if inserted is None:
+            existing_stmt = select(Policy.policy_id).where(
+                Policy.file_hash == file_hash,
+                Policy.deleted_at.is_(None)
+            )
+            existing_policy_id = (await db.execute(existing_stmt)).scalar_one_or_none()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"{ERROR_POLICY_ALREADY_EXISTS}: {existing_policy.policy_id}"
+                detail=f"{ERROR_POLICY_ALREADY_EXISTS}: {existing_policy_id}"
             )
         
-        # Save file to disk
-        with open(file_path, "wb") as f:
-            f.write(content)
-        
-        # Create database record
-        db_policy = Policy(
-            policy_id=policy_id,
-            filename=file.filename,
-            file_path=str(file_path),
-            file_size=file_size,
-            file_hash=file_hash,
-            content_type=file.content_type,
-            status=PolicyStatus.UPLOADED,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
+        # Stored only once the row is in; a failed write rolls the insert back
+        await save_upload_file(file, file_path, MAX_FILE_SIZE_BYTES)
+        logger.debug(f"File stored successfully: {file_size} bytes")
         
-        db.add(db_policy)
         await db.commit()
-        await db.refresh(db_policy)
         
         logger.info(f"Policy uploaded successfully: {policy_id} ({file.filename})")
         
         # Create response
         return PolicyUploadResponse(
-            id=db_policy.id,
-            policy_id=db_policy.policy_id,
-            filename=db_policy.filename,
-            file_size=db_policy.file_size,
-            content_type=db_policy.content_type,
-            upload_timestamp=db_policy.created_at,
+            id=inserted.id,
+            policy_id=policy_id,
+            filename=file.filename,
+            file_size=file_size,
+            content_type=file.content_type,
+            upload_timestamp=inserted.created_at,
             storage_path=str(file_path),
-            status=db_policy.status.value
+            status=PolicyStatus.UPLOADED.value
         )
         
     except HTTPException:
         # Clean up file if it was created
-        if file_path.exists():
-            file_path.unlink()
+        await remove_file(file_path)
         logger.warning(f"Policy upload failed (validation): {file.filename}")
         raise
+    except IntegrityError:
+        # A concurrent upload claimed the same content hash first, e.g.
+        # while backfilling a candidate; the session is rolled back by get_db
+        await remove_file(file_path)
+        logger.warning(f"Policy upload failed (concurrent duplicate): {file.filename}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ERROR_POLICY_ALREADY_EXISTS
+        )
     except Exception as e:
         # Clean up file if it was created
-        if file_path.exists():
-            file_path.unlink()
+        await remove_file(file_path)
         logger.error(f"Policy upload failed: {file.filename}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload file: {str(e)}"
         )
     finally:
+        _upload_sem.release()
         await file.close()
 
 
@@ -188,9 +423,10 @@ async def list_policies(
     db: AsyncSession = Depends(get_db),
     status_filter: Optional[PolicyStatusEnum] = Query(None, alias="status", description="Filter by status"),
     policy_type: Optional[PolicyTypeEnum] = Query(None, description="Filter by policy type"),
-    jurisdiction: Optional[str] = Query(None, description="Filter by jurisdiction"),
+    jurisdiction: Optional[str] = Query(None, description="Filter by jurisdiction (substring; under 3 characters matches exactly)"),
     limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Number of results per page"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    offset: int = Query(0, ge=0, le=MAX_PAGE_OFFSET, description="Deprecated: number of results to skip (ignored when cursor is given); use cursor for deep pages"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor")
 ) -> PolicyListResponse:
     """
     List all uploaded policy documents with pagination and filtering.
@@ -202,43 +438,99 @@ async def list_policies(
         jurisdiction: Optional jurisdiction filter
         limit: Number of results per page
         offset: Number of results to skip
+        cursor: Keyset cursor returned as next_cursor by the previous page
         
     Returns:
         PolicyListResponse: Paginated list of policies
     """
     logger.info(f"Listing policies: limit={limit}, offset={offset}, status={status_filter}, type={policy_type}")
     
-    # Build query
-    query = select(Policy).where(Policy.deleted_at.is_(None))
-    
-    # Apply filters
-    if status_filter:
-        query = query.where(Policy.status == status_filter.value)
-    if policy_type:
-        query = query.where(Policy.policy_type == policy_type.value)
-    if jurisdiction:
-        query = query.where(Policy.jurisdiction.ilike(f"%{jurisdiction}%"))
+    # Reuse the prebuilt queries for this filter combination
+    page_query, count_query, _ = _list_policies_queries(
+        status_filter is not None,
+        policy_type is not None,
+        bool(jurisdiction),
+        cursor is not None
+    )
+    params = _list_policies_params(status_filter, policy_type, jurisdiction, limit, offset, cursor)
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    result = await db.execute(page_query, params)
     
-    # Apply pagination and ordering
-    query = query.order_by(Policy.created_at.desc()).limit(limit).offset(offset)
+    if cursor is not None:
+        # Cursor pages are for infinite scroll; a total would cost a full count
+        policies = result.scalars().all()
+        total = None
+    else:
+        # Rows and filtered total in one round trip
+        rows = result.all()
+        policies = [row.Policy for row in rows]
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Past the end: no rows to carry the window total
+            total = (await db.execute(count_query, params)).scalar()
+        else:
+            total = 0
     
-    # Execute query
-    result = await db.execute(query)
-    policies = result.scalars().all()
+    next_cursor = None
+    if len(policies) == limit:
+        next_cursor = encode_cursor(policies[-1].created_at, policies[-1].id)
     
     logger.info(f"Found {len(policies)} policies (total: {total})")
     
-    return PolicyListResponse(
-        policies=[PolicyPublic.model_validate(p) for p in policies],
-        total=total,
-        limit=limit,
-        offset=offset
+    body = _encode_policy_list(policies, total, limit, params["offset"], next_cursor)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Stream Policies as NDJSON",
+    description="Stream policy documents as newline-delimited JSON, one object per line, for large exports."
+)
+async def stream_policies(
+    status_filter: Optional[PolicyStatusEnum] = Query(None, alias="status", description="Filter by status"),
+    policy_type: Optional[PolicyTypeEnum] = Query(None, description="Filter by policy type"),
+    jurisdiction: Optional[str] = Query(None, description="Filter by jurisdiction (substring; under 3 characters matches exactly)"),
+    limit: int = Query(MAX_STREAM_LIMIT, ge=1, le=MAX_STREAM_LIMIT, description="Maximum number of policies to stream"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor to resume after")
+) -> StreamingResponse:
+    """
+    Stream policies as NDJSON straight from the database cursor.
+    
+    Rows are serialized with orjson as they arrive, skipping Pydantic, so
+    memory stays flat regardless of limit. Resume an interrupted export by
+    passing a cursor built from the last received row.
+    
+    Args:
+        status_filter: Optional status filter
+        policy_type: Optional policy type filter
+        jurisdiction: Optional jurisdiction filter
+        limit: Maximum number of policies to stream
+        cursor: Keyset cursor to resume after
+        
+    Returns:
+        StreamingResponse: application/x-ndjson body with one policy per line
+    """
+    logger.info(f"Streaming policies: limit={limit}, status={status_filter}, type={policy_type}")
+    
+    _, _, stream_query = _list_policies_queries(
+        status_filter is not None,
+        policy_type is not None,
+        bool(jurisdiction),
+        cursor is not None
     )
+    params = _list_policies_params(status_filter, policy_type, jurisdiction, limit, 0, cursor)
+    
+    async def generate():
+        # The request-scoped session is closed before the body is sent, so
+        # the stream owns its own session for as long as rows are produced
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(stream_query, params)
+            async for row in result:
+                yield orjson.dumps(row._asdict()) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -259,28 +551,37 @@ async def get_policy(
         db: Database session
         
     Returns:
-        PolicyPublic: Policy details
+        PolicyPublic: Policy details, served from the response cache while
+        the policy's updated_at is unchanged
         
     Raises:
         HTTPException: If policy not found
     """
     logger.info(f"Fetching policy: {policy_id}")
-    stmt = select(Policy).where(
-        Policy.policy_id == policy_id,
-        Policy.deleted_at.is_(None)
-    )
-    result = await db.execute(stmt)
-    policy = result.scalar_one_or_none()
     
-    if not policy:
-        logger.warning(f"Policy not found: {policy_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy with ID '{policy_id}' not found"
-        )
+    # Probe the version token first; a cache hit skips loading the full row
+    updated_at = (
+        await db.execute(_SELECT_LIVE_POLICY_UPDATED_AT, {"policy_id": policy_id})
+    ).scalar_one_or_none()
+    body = None if updated_at is None else _policy_response_cache.get((policy_id, updated_at))
+    
+    if body is None:
+        result = await db.execute(_SELECT_LIVE_POLICY, {"policy_id": policy_id})
+        policy = result.scalar_one_or_none()
+        
+        if not policy:
+            logger.warning(f"Policy not found: {policy_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Policy with ID '{policy_id}' not found"
+            )
+        
+        # Trusted DB row: construct without validation (never for untrusted data)
+        body = orjson.dumps(from_orm_fast(PolicyPublic, policy).model_dump(mode="json"))
+        _policy_response_cache[(policy_id, policy.updated_at)] = body
     
     logger.debug(f"Policy found: {policy_id}")
-    return PolicyPublic.model_validate(policy)
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete(
@@ -304,24 +605,17 @@ async def delete_policy(
         HTTPException: If policy not found
     """
     logger.info(f"Deleting policy: {policy_id}")
-    stmt = select(Policy).where(
-        Policy.policy_id == policy_id,
-        Policy.deleted_at.is_(None)
-    )
-    result = await db.execute(stmt)
-    policy = result.scalar_one_or_none()
     
-    if not policy:
+    # Soft delete in place; rowcount tells us whether a live policy matched
+    result = await db.execute(_SOFT_DELETE_LIVE_POLICY, {"target_policy_id": policy_id})
+    
+    if result.rowcount == 0:
         logger.warning(f"Policy not found for deletion: {policy_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Policy with ID '{policy_id}' not found"
         )
     
-    # Soft delete
-    policy.deleted_at = datetime.utcnow()
-    policy.updated_at = datetime.utcnow()
-    
     await db.commit()
     logger.info(f"Policy deleted successfully: {policy_id}")
 
@@ -374,11 +668,13 @@ async def extract_policy_text(
 @router.get(
     "/{policy_id}/text",
     response_model=ExtractedTextResponse,
+    response_model_exclude_none=True,
     summary="Get Extracted Text",
     description="Retrieve the full extracted text content from a policy document."
 )
 async def get_policy_text(
     policy_id: str,
+    metadata_only: bool = Query(False, description="Return only the counts, without the text"),
     db: AsyncSession = Depends(get_db)
 ) -> ExtractedTextResponse:
     """
@@ -386,6 +682,7 @@ async def get_policy_text(
     
     Args:
         policy_id: Unique policy identifier
+        metadata_only: If True, omit the extracted text from the response
         db: Database session
         
     Returns:
@@ -397,24 +694,16 @@ async def get_policy_text(
     logger.info(f"Retrieving extracted text for policy: {policy_id}")
     
     try:
-        # Get policy
-        stmt = select(Policy).where(
-            Policy.policy_id == policy_id,
-            Policy.deleted_at.is_(None)
-        )
-        result = await db.execute(stmt)
-        policy = result.scalar_one_or_none()
+        # Filename, stored counts and (unless omitted) text in one round trip
+        record = await get_extracted_text_record(policy_id, db, include_text=not metadata_only)
         
-        if not policy:
+        if record is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Policy with ID '{policy_id}' not found"
             )
         
-        # Get extracted text
-        extracted_text = await get_extracted_text(policy_id, db)
-        
-        if not extracted_text:
+        if record.character_count is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=ERROR_NO_EXTRACTED_TEXT
@@ -422,10 +711,10 @@ async def get_policy_text(
         
         return ExtractedTextResponse(
             policy_id=policy_id,
-            filename=policy.filename,
-            extracted_text=extracted_text,
-            character_count=len(extracted_text),
-            word_count=len(extracted_text.split()),
+            filename=record.filename,
+            extracted_text=None if metadata_only else record.extracted_text,
+            character_count=record.character_count,
+            word_count=record.word_count,
             extraction_timestamp=datetime.utcnow()
         )
         
@@ -439,6 +728,59 @@ async def get_policy_text(
         )
 
 
+@router.get(
+    "/{policy_id}/download",
+    response_class=FileResponse,
+    summary="Download Policy Document",
+    description="Download the original uploaded policy document."
+)
+async def download_policy(
+    policy_id: str,
+    db: AsyncSession = Depends(get_db)
+) -> FileResponse:
+    """
+    Download the stored file for a policy.
+    
+    The file is streamed by Starlette's FileResponse, which reads it in
+    64 KiB chunks in a worker thread, so a large document is never held in
+    memory whole and the event loop is not blocked on disk reads.
+    
+    Args:
+        policy_id: Unique policy identifier
+        db: Database session
+        
+    Returns:
+        FileResponse: The original uploaded document
+        
+    Raises:
+        HTTPException: If the policy or its stored file is not found
+    """
+    row = (await db.execute(_SELECT_LIVE_POLICY_FILE, {"policy_id": policy_id})).first()
+    
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Policy with ID '{policy_id}' not found"
+        )
+    
+    # Stat once here; FileResponse reuses the result for its headers
+    try:
+        stat_result = await asyncio.to_thread(os.stat, row.file_path)
+    except FileNotFoundError:
+        logger.error(f"Stored file missing for policy {policy_id}: {row.file_path}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ERROR_POLICY_FILE_MISSING
+        )
+    
+    return FileResponse(
+        row.file_path,
+        media_type=row.content_type,
+        filename=row.filename,
+        stat_result=stat_result
+    )
+
+
 @router.patch(
     "/{policy_id}",
     response_model=PolicyPublic,
@@ -453,7 +795,8 @@ async def patch_policy_metadata(
     """Update policy metadata and bump version."""
     try:
         updated_policy = await update_policy_metadata(policy_id, update_data, db)
-        return PolicyPublic.model_validate(updated_policy)
+        # Trusted DB row: construct without validation (never for untrusted data)
+        return from_orm_fast(PolicyPublic, updated_policy)
     except PolicyVersionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -479,7 +822,8 @@ async def get_versions(
         versions = await list_policy_versions(policy_id, db)
         return PolicyVersionListResponse(
             policy_id=policy_id,
-            versions=[PolicyVersionPublic.model_validate(v) for v in versions],
+            # Trusted DB rows: construct without validation (never for untrusted data)
+            versions=[from_orm_fast(PolicyVersionPublic, v) for v in versions],
             total=len(versions)
         )
     except PolicyVersionError as e:
@@ -506,7 +850,8 @@ async def get_version(
     """Retrieve one snapshot by version number."""
     try:
         version = await get_policy_version(policy_id, version_number, db)
-        return PolicyVersionPublic.model_validate(version)
+        # Trusted DB row: construct without validation (never for untrusted data)
+        return from_orm_fast(PolicyVersionPublic, version)
     except PolicyVersionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -531,7 +876,8 @@ async def restore_version(
     """Restore policy to a previous version."""
     try:
         restored_policy = await restore_policy_version(policy_id, version_number, db)
-        return PolicyPublic.model_validate(restored_policy)
+        # Trusted DB row: construct without validation (never for untrusted data)
+        return from_orm_fast(PolicyPublic, restored_policy)
     except PolicyVersionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -7,7 +7,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-import json
+import orjson
 
 from app.core.database import get_db
 from app.schemas.rag import RAGQueryRequest, RAGResponse, RAGStreamChunk
@@ -148,7 +148,7 @@ async def ask_question_stream(
                 language=request.language
             ):
                 # Convert chunk to JSON and send with newline delimiter
-                yield json.dumps(chunk) + "\n"
+                yield orjson.dumps(chunk) + b"\n"
                 
         except LLMError as e:
             logger.error(f"LLM error in streaming: {e}")
@@ -157,7 +157,7 @@ async def ask_question_stream(
                 "error": "LLM service error",
                 "details": str(e)
             }
-            yield json.dumps(error_chunk) + "\n"
+            yield orjson.dumps(error_chunk) + b"\n"
             
         except RAGError as e:
             logger.error(f"RAG error in streaming: {e}")
@@ -166,7 +166,7 @@ async def ask_question_stream(
                 "error": "RAG pipeline error",
                 "details": str(e)
             }
-            yield json.dumps(error_chunk) + "\n"
+            yield orjson.dumps(error_chunk) + b"\n"
             
         except Exception as e:
             logger.error(f"Unexpected error in streaming: {e}")
@@ -175,7 +175,7 @@ async def ask_question_stream(
                 "error": "Failed to process question",
                 "details": str(e)
             }
-            yield json.dumps(error_chunk) + "\n"
+            yield orjson.dumps(error_chunk) + b"\n"
     
     return StreamingResponse(
         generate(),
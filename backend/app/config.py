@@ -1,5 +1,6 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Tuple
 
 
 class Settings(BaseSettings):
@@ -19,6 +20,10 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./civiclens.db"
+    DB_STATEMENT_CACHE_SIZE: int = 500  # Prepared statements kept per asyncpg connection
+    DB_POOL_SIZE: int = 20  # PostgreSQL only; SQLite uses a small fixed pool
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_WARMUP: int = 5  # Connections opened at startup so first requests skip connect cost
     
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
@@ -46,14 +51,12 @@ class Settings(BaseSettings):
     LLM_MAX_TOKENS: int = 1000
     LLM_BASE_URL: str = "https://api.openai.com/v1"
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Convert comma-separated CORS origins to list."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Convert comma-separated CORS origins to a tuple, parsed once."""
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
 # Global settings instance
@@ -11,16 +11,27 @@ POLICY_UPLOAD_DIR = UPLOAD_BASE_DIR / "policies"
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
 ALLOWED_FILE_EXTENSIONS = {".pdf"}
 ALLOWED_CONTENT_TYPES = {"application/pdf"}
+MAX_CONCURRENT_UPLOADS = 8  # Uploads processed at once per worker process
+UPLOAD_SLOT_TIMEOUT_SECONDS = 5  # Wait for a free upload slot before answering 503
 
 # Pagination Defaults
 DEFAULT_PAGE_LIMIT = 20
 MIN_PAGE_LIMIT = 1
 MAX_PAGE_LIMIT = 100
+MAX_STREAM_LIMIT = 10000
 DEFAULT_PAGE_OFFSET = 0
+MAX_PAGE_OFFSET = 10000  # Deeper pages must use the keyset cursor
+JURISDICTION_SUBSTRING_MIN_LENGTH = 3  # Shorter jurisdiction filters match exactly
+
+# Response Caching
+POLICY_RESPONSE_CACHE_SIZE = 1024  # Serialized get_policy responses kept per process
 
 # File Hashing
 HASH_ALGORITHM = "sha256"
-HASH_BUFFER_SIZE = 65536  # 64KB chunks for hashing
+HASH_BUFFER_SIZE = 1024 * 1024  # 1MB chunks for hashing; matches UPLOAD_CHUNK_SIZE so one buffer serves both
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB chunks when streaming uploads to disk
+BULK_REHASH_BATCH_SIZE = 64  # Policies hashed and committed per batch
+BULK_REHASH_WORKERS = 4  # Files hashed concurrently during bulk re-hashing
 
 # Policy ID Generation
 POLICY_ID_PREFIX = "pol_"
@@ -30,8 +41,10 @@ POLICY_ID_LENGTH = 12  # Length of random part after prefix
 ERROR_FILE_TOO_LARGE = "File size exceeds maximum allowed size of {max_size}MB"
 ERROR_INVALID_FILE_TYPE = "Invalid file type. Only PDF files are allowed"
 ERROR_FILE_UPLOAD_FAILED = "Failed to upload file"
+ERROR_TOO_MANY_UPLOADS = "Too many uploads in progress, please retry shortly"
 ERROR_POLICY_NOT_FOUND = "Policy not found"
 ERROR_POLICY_ALREADY_EXISTS = "A policy with this file hash already exists"
+ERROR_POLICY_FILE_MISSING = "Stored file for this policy is missing"
 ERROR_DATABASE_ERROR = "Database operation failed"
 
 # Success Messages
@@ -40,6 +53,9 @@ SUCCESS_POLICY_DELETED = "Policy deleted successfully"
 
 # Text Extraction Configuration
 TEXT_PREVIEW_LENGTH = 500  # Length of text preview in API responses
+PDF_PARALLEL_MIN_PAGES = 32  # Documents this long are extracted on the page worker pool
+PDF_PAGES_PER_TASK = 16  # Pages handed to a worker per task, amortising IPC
+PDF_EXTRACTION_WORKERS = 4  # Worker processes extracting page ranges
 
 # Text Extraction Messages
 SUCCESS_TEXT_EXTRACTION_STARTED = "Text extraction started"
@@ -3,10 +3,16 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 with async support.
 """
 
+import asyncio
+
+from sqlalchemy import DateTime, LargeBinary, event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
-from typing import AsyncGenerator
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.types import TypeDecorator
+from typing import AsyncGenerator, Optional
 from app.config import settings
 
 
@@ -14,15 +20,70 @@ from app.config import settings
 DATABASE_URL = settings.DATABASE_URL
 
 
+def _connect_args(database_url: str) -> dict:
+    """
+    Driver-specific connection arguments.
+    
+    asyncpg prepares every statement server-side and keeps the plans in a
+    per-connection LRU keyed by SQL text. Our hot queries are built once at
+    import, so their text is stable and repeat lookups skip parse/plan.
+    """
+    if "sqlite" in database_url:
+        return {"check_same_thread": False}
+    if "asyncpg" in database_url:
+        return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return {}
+
+
+def _pool_options(database_url: str) -> dict:
+    """
+    Connection pool settings for the configured backend.
+    
+    aiosqlite defaults file databases to NullPool, which opens a new
+    connection (and a cold page cache) for every session; keep a small
+    pool instead. In-memory SQLite keeps its default single shared
+    connection.
+    """
+    if "sqlite" in database_url:
+        if ":memory:" in database_url:
+            return {}
+        return {"poolclass": AsyncAdaptedQueuePool, "pool_size": 5, "max_overflow": 10}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=settings.ENVIRONMENT == "development",  # Log SQL in development
-    future=True,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    connect_args=_connect_args(DATABASE_URL),
+    **_pool_options(DATABASE_URL),
 )
 
 
+# Applied once per physical SQLite connection: WAL lets readers proceed
+# during writes, and the larger cache/mmap keep hot pages in memory
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+if "sqlite" in DATABASE_URL:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -39,6 +100,52 @@ class Base(DeclarativeBase):
     pass
 
 
+class sql_utcnow(FunctionElement):
+    """
+    Current UTC time evaluated by the database, for naive UTC DateTime columns.
+    
+    Use as a column default/onupdate so the database stamps rows itself.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(sql_utcnow)
+def _sql_utcnow_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(sql_utcnow, "postgresql")
+def _sql_utcnow_postgresql(element, compiler, **kw) -> str:
+    # now() follows the session time zone; columns are naive UTC
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(sql_utcnow, "sqlite")
+def _sql_utcnow_sqlite(element, compiler, **kw) -> str:
+    # Same microsecond-width text SQLAlchemy writes for Python datetimes, so
+    # DB- and app-stamped values compare correctly as strings
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class HexDigest(TypeDecorator):
+    """
+    Hash digest stored as raw bytes (BYTEA/BLOB) but handled as hex in Python.
+    
+    A SHA-256 key takes 32 bytes instead of a 64-character string, halving
+    the size of any index over it; application code keeps comparing and
+    serialising hex digests unchanged.
+    """
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        return None if value is None else value.hex()
+
+
 # Dependency for FastAPI endpoints
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -49,18 +156,19 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async def endpoint(db: AsyncSession = Depends(get_db)):
             ...
     
+    The session never commits on its own: endpoints that write call
+    ``await db.commit()`` explicitly, so read-only requests skip the extra
+    COMMIT round trip. Anything left uncommitted is rolled back on close.
+    
     Yields:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
 async def init_db() -> None:
@@ -79,6 +187,27 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_pool(connections: int) -> None:
+    """
+    Open pooled connections concurrently and return them to the pool.
+    
+    The first burst of requests then checks out ready connections instead
+    of each paying the connect/handshake cost. Pools that keep no idle
+    connections (in-memory SQLite, NullPool) are left alone.
+    
+    Args:
+        connections: How many connections to open, capped at the pool size
+    """
+    pool_size = getattr(engine.pool, "size", None)
+    if pool_size is None or connections <= 0:
+        return
+    # All are held at once so each one is a distinct pooled connection
+    conns = await asyncio.gather(*(
+        engine.connect() for _ in range(min(connections, pool_size()))
+    ))
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
 async def close_db() -> None:
     """
     Close database connections.
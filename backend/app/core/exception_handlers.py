@@ -4,7 +4,7 @@ Provides global exception handling for FastAPI application.
 """
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 async def civiclens_exception_handler(
     request: Request,
     exc: CivicLensException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle custom CivicLens exceptions.
     
@@ -41,7 +41,7 @@ async def civiclens_exception_handler(
         exc_info=True
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -56,7 +56,7 @@ async def civiclens_exception_handler(
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle HTTP exceptions.
     
@@ -76,7 +76,7 @@ async def http_exception_handler(
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -91,7 +91,7 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle request validation errors.
     
@@ -119,7 +119,7 @@ async def validation_exception_handler(
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -134,7 +134,7 @@ async def validation_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle unexpected exceptions.
     
@@ -154,7 +154,7 @@ async def general_exception_handler(
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
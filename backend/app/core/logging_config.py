@@ -3,13 +3,33 @@ Logging configuration for CivicLens AI backend.
 Provides structured logging with file and console handlers.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
-import json
+
+import orjson
+
+
+# Background thread writing queued records to the log files; see setup_logging
+_queue_listener: Optional[QueueListener] = None
+
+
+# Attributes every LogRecord carries; anything else came in through extra=
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """record.getMessage() without the call when there is nothing to format."""
+    msg = record.msg
+    if record.args or type(msg) is not str:
+        return record.getMessage()
+    return msg
 
 
 class JSONFormatter(logging.Formatter):
@@ -18,28 +38,93 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": record.created,
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": _record_message(record),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
         
-        # Add exception info if present
+        # Add exception info if present; the rendered traceback is cached on
+        # the record so the general and error log files format it only once
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
         
-        # Add extra fields if present
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        # Add extra fields if present, so one event can carry its full context
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in log_data:
+                log_data[key] = value
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves records intact for the file formatters.
+    
+    The queue never leaves the process, so records need not be made
+    picklable; only the message is rendered up front so later changes to
+    its arguments cannot alter what gets written.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = _record_message(record)
+        record.args = None
+        return record
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that leaves flushing to its caller.
+    
+    The stock handler formats each record twice (once for the rollover
+    size check) and flushes the file after every record. Here the record
+    is formatted once and written into the file object's buffer, so a
+    burst of records reaches the disk in a few large writes; the
+    QueueListener flushes once its queue drains.
+    
+    The file size is tracked in bytes as records are written: asking the
+    stream for its position would flush the buffer on every record.
+    """
+    
+    _size = 0
+    
+    def _open(self):
+        stream = super()._open()
+        # Appending, so the position is the size of what is already there
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg.encode(self.encoding or "utf-8"))
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -55,17 +140,27 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, datefmt: str = '%Y-%m-%d %H:%M:%S'):
+        super().__init__(datefmt=datefmt)
+        # Colored text around the timestamp per level, built once instead
+        # of per record: ("<color>[", "] LEVEL    <reset> ")
+        reset = self.COLORS['RESET']
+        self._level_parts = {
+            level: (f"{color}[", f"] {level:8s}{reset} ")
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
-        
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+        parts = self._level_parts.get(record.levelname)
+        if parts is None:
+            reset = self.COLORS['RESET']
+            parts = (f"{reset}[", f"] {record.levelname:8s}{reset} ")
         
-        # Build log message
-        log_msg = f"{color}[{timestamp}] {record.levelname:8s}{reset} "
-        log_msg += f"{record.name} - {record.getMessage()}"
+        # formatTime uses time.strftime; no datetime object per record
+        log_msg = f"{parts[0]}{self.formatTime(record, self.datefmt)}{parts[1]}"
+        log_msg += f"{record.name} - {_record_message(record)}"
         
         # Add exception info if present
         if record.exc_info:
@@ -91,6 +186,8 @@ def setup_logging(
         log_to_console: Whether to log to console
         json_logs: Whether to use JSON format for file logs
     """
+    global _queue_listener
+    
     # Create logs directory if it doesn't exist
     if log_to_file:
         log_path = Path(log_dir)
@@ -101,6 +198,7 @@ def setup_logging(
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
     # Remove existing handlers
+    stop_logging()
     root_logger.handlers.clear()
     
     # Console handler
@@ -113,7 +211,7 @@ def setup_logging(
     # File handlers
     if log_to_file:
         # General log file
-        general_handler = RotatingFileHandler(
+        general_handler = _BufferedRotatingFileHandler(
             filename=Path(log_dir) / "civiclens.log",
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
@@ -130,10 +228,9 @@ def setup_logging(
                     datefmt='%Y-%m-%d %H:%M:%S'
                 )
             )
-        root_logger.addHandler(general_handler)
         
         # Error log file (only errors and above)
-        error_handler = RotatingFileHandler(
+        error_handler = _BufferedRotatingFileHandler(
             filename=Path(log_dir) / "errors.log",
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
@@ -150,7 +247,14 @@ def setup_logging(
                     datefmt='%Y-%m-%d %H:%M:%S'
                 )
             )
-        root_logger.addHandler(error_handler)
+        
+        # File writes happen on a listener thread; logging calls only enqueue
+        log_queue = queue.SimpleQueue()
+        _queue_listener = _BatchingQueueListener(
+            log_queue, general_handler, error_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(_InProcessQueueHandler(log_queue))
     
     # Set levels for third-party loggers to reduce noise
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -162,6 +266,17 @@ def setup_logging(
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_to_file}, Console: {log_to_console}")
 
 
+def stop_logging() -> None:
+    """Flush queued records to the log files and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance.
@@ -2,94 +2,146 @@
 Middleware for logging and error tracking.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-import time
-import uuid
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl
 import logging
-from typing import Callable
+import os
+import time
 
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all incoming requests and responses."""
-    
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    """First value of a (lower-case) request header, straight from the scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestLoggingMiddleware:
+    """
+    Middleware to log all incoming requests and responses.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, so no Request
+    or Response objects and no extra task are created per request; the
+    status code and request ID header are handled on the raw send messages.
+    """
+
+    def __init__(self, app: ASGIApp, skip_path_prefixes: Tuple[str, ...] = ()):
+        self.app = app
+        # Paths passed straight through unlogged (e.g. probe endpoints)
+        self.skip_path_prefixes = skip_path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log details.
-        
+
         Args:
-            request: FastAPI request object
-            call_next: Next middleware/route handler
-            
-        Returns:
-            Response object
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        
-        # Log request
-        start_time = time.time()
-        
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": dict(request.query_params),
-                "client_host": request.client.host if request.client else None
-            }
-        )
-        
-        # Process request
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # Generate unique request ID (128 random bits as hex, no UUID object);
+        # exposed to handlers as request.state.request_id
+        request_id = os.urandom(16).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        query_string = scope.get("query_string", b"")
+
+        # One wide event per request: this context is logged once, on
+        # completion or failure, with the outcome fields filled in
+        log_context = {
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "query_params": dict(parse_qsl(query_string.decode("latin-1"))) if query_string else {},
+            "client_host": client[0] if client else None,
+            "user_agent": _header(scope, b"user-agent")
+        }
+
+        start_time = time.perf_counter()
+
+        # Start lines only when debugging; the completion event has it all
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Request started: {method} {path}", extra=log_context)
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        # Process request. Errors are caught right here at the ASGI boundary,
+        # with no task hop in between, so the traceback and request ID stay
+        # together; BaseException also covers cancelled requests.
         try:
-            response = await call_next(request)
-            
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log response
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2)
-                }
-            )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
-        except Exception as exc:
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log error
-            logger.error(
-                f"Request failed: {request.method} {request.url.path}",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_ms": round(duration_ms, 2),
-                    "exception": str(exc)
-                },
-                exc_info=True
-            )
-            
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # Log error; status_code is None if no response was started
+            log_context["status_code"] = status_code
+            log_context["response_started"] = status_code is not None
+            log_context["duration_ms"] = round(duration_ms, 2)
+            log_context["exception"] = str(exc)
+            logger.error(f"Request failed: {method} {path}", extra=log_context, exc_info=exc)
+
             # Re-raise exception to be handled by exception handlers
             raise
+
+        # Calculate duration
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Log response
+        log_context["status_code"] = status_code
+        log_context["duration_ms"] = round(duration_ms, 2)
+        logger.info(f"Request completed: {method} {path} - {status_code}", extra=log_context)
+
+
+class _JSONGZipResponder(GZipResponder):
+    """GZipResponder that leaves every non-JSON response untouched."""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if not content_type.startswith("application/json"):
+                # Treated like an already-encoded response: passed through as-is
+                self.content_encoding_set = True
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """
+    Gzip JSON responses only.
+
+    PDF downloads gain little from compression, and streamed NDJSON would
+    be held back by the compressor's buffering, so both go out unchanged.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = _JSONGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -1,14 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from app.config import settings
 from app.api.v1.router import api_router
-from app.core.database import close_db, init_db, ensure_audit_columns
-from app.core.logging_config import setup_logging
-from app.core.middleware import RequestLoggingMiddleware
+from app.api.v1.endpoints import health
+from app.schemas.health import HealthResponse
+from app.core.database import close_db, init_db, ensure_audit_columns, warm_up_pool
+from app.core.logging_config import setup_logging, stop_logging
+from app.services.text_extraction import shutdown_page_pool
+from app.core.middleware import JSONGZipMiddleware, RequestLoggingMiddleware
 from app.core.exceptions import CivicLensException
 from app.core.exception_handlers import (
     civiclens_exception_handler,
@@ -17,37 +23,87 @@ from app.core.exception_handlers import (
     general_exception_handler
 )
 
-# Setup logging
-setup_logging(
-    log_level=settings.LOG_LEVEL,
-    log_dir=settings.LOG_DIR,
-    log_to_file=settings.LOG_TO_FILE,
-    log_to_console=settings.LOG_TO_CONSOLE,
-    json_logs=settings.LOG_JSON_FORMAT
-)
+# Setup logging; skipped when this module is imported again into a
+# process that is already configured (e.g. uvicorn --reload)
+if not logging.getLogger().handlers:
+    setup_logging(
+        log_level=settings.LOG_LEVEL,
+        log_dir=settings.LOG_DIR,
+        log_to_file=settings.LOG_TO_FILE,
+        log_to_console=settings.LOG_TO_CONSOLE,
+        json_logs=settings.LOG_JSON_FORMAT
+    )
 
 logger = logging.getLogger(__name__)
 
+# Mount point of the internal probe app
+INTERNAL_PREFIX = "/internal"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run startup before the app serves requests and shutdown after it stops."""
+    await init_db()
+    await ensure_audit_columns()
+    await warm_up_pool(settings.DB_POOL_WARMUP)
+    # One structured event for the whole transition instead of a line per fact
+    logger.info(
+        f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} started ({settings.ENVIRONMENT})",
+        extra={
+            "event": "startup",
+            "app": settings.APP_NAME,
+            "version": settings.APP_VERSION,
+            "env": settings.ENVIRONMENT,
+            "db_host": settings.DATABASE_URL.split('@')[-1],  # Hide credentials
+            "docs_url": f"http://{settings.HOST}:{settings.PORT}/docs",
+            "log_level": settings.LOG_LEVEL,
+            "log_dir": settings.LOG_DIR
+        }
+    )
+    try:
+        yield
+    finally:
+        await close_db()
+        # Spawned extraction workers would otherwise outlive a reload
+        shutdown_page_pool()
+        logger.info(
+            f"👋 {settings.APP_NAME} shut down",
+            extra={
+                "event": "shutdown",
+                "app": settings.APP_NAME,
+                "version": settings.APP_VERSION,
+                "env": settings.ENVIRONMENT
+            }
+        )
+        # Drain queued records to the log files last, after the shutdown event
+        stop_logging()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="AI-powered platform to translate government policies into personalized, multilingual guidance",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson serializes responses natively in Rust
+    lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS; a frozenset makes the per-request origin check one hash lookup
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=frozenset(settings.cors_origins_list),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Add request logging middleware
-app.add_middleware(RequestLoggingMiddleware)
+# Compress JSON bodies of 1KB+ (e.g. policy listings); added before the
+# logging middleware so compression time is part of the logged duration
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# Add request logging middleware; probes under /internal are not logged
+app.add_middleware(RequestLoggingMiddleware, skip_path_prefixes=(INTERNAL_PREFIX,))
 
 # Register exception handlers
 app.add_exception_handler(CivicLensException, civiclens_exception_handler)
@@ -58,6 +114,14 @@ app.add_exception_handler(Exception, general_exception_handler)
 # Include API v1 router
 app.include_router(api_router, prefix="/api/v1")
 
+# Liveness/readiness probes: a bare sub-app with no middleware, docs or
+# exception handlers of its own. Point probes at /internal/health.
+internal_app = FastAPI(
+    docs_url=None, redoc_url=None, openapi_url=None, default_response_class=ORJSONResponse
+)
+internal_app.add_api_route("/health", health.health_check, response_model=HealthResponse)
+app.mount(INTERNAL_PREFIX, internal_app)
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -68,28 +132,3 @@ async def root():
         "docs": "/docs",
         "health": "/api/v1/health"
     }
-
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} starting...")
-    logger.info(f"📍 Environment: {settings.ENVIRONMENT}")
-    logger.info(f"💾 Database: {settings.DATABASE_URL.split('@')[-1]}")  # Hide credentials
-    logger.info(f"🔗 Docs: http://{settings.HOST}:{settings.PORT}/docs")
-    logger.info(f"📝 Logging: Level={settings.LOG_LEVEL}, Dir={settings.LOG_DIR}")
-    await init_db()
-    await ensure_audit_columns()
-    logger.info("✅ Database tables and audit columns ready")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info(f"👋 {settings.APP_NAME} shutting down...")
-    logger.info("💾 Closing database connections...")
-    await close_db()
-    logger.info("✅ Shutdown complete")
-
@@ -4,14 +4,16 @@ SQLAlchemy models for policy documents and related entities.
 
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, Boolean, 
-    ForeignKey, Index, BigInteger, JSON, Enum as SQLEnum
+    ForeignKey, Index, BigInteger, JSON, Enum as SQLEnum, Computed, text
 )
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql.expression import FunctionElement
 from typing import Optional
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, HexDigest, sql_utcnow
 
 
 class PolicyStatus(str, enum.Enum):
@@ -37,6 +39,45 @@ class PolicyType(str, enum.Enum):
     OTHER = "other"
 
 
+class search_document(FunctionElement):
+    """
+    Generated-column expression for policies.search_vector.
+    
+    PostgreSQL builds a tsvector from the title and description; other
+    databases have no tsvector, so the column stays an always-NULL placeholder.
+    """
+    inherit_cache = True
+
+
+@compiles(search_document)
+def _search_document_default(element, compiler, **kw) -> str:
+    return "NULL"
+
+
+@compiles(search_document, "postgresql")
+def _search_document_postgresql(element, compiler, **kw) -> str:
+    return "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+
+def _enum_column(enum_class: type, name: str) -> SQLEnum:
+    """
+    Store an enum as VARCHAR(20) holding member values, guarded by a CHECK constraint.
+    
+    No native database ENUM type is created; the ORM still hands back enum
+    members. Adding a member still needs a migration that replaces the
+    CHECK constraint, which guards PostgreSQL and freshly created SQLite
+    tables alike.
+    """
+    return SQLEnum(
+        enum_class,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        length=20,
+        values_callable=lambda members: [member.value for member in members]
+    )
+
+
 class Policy(Base):
     """
     Main policy document model.
@@ -58,7 +99,7 @@ class Policy(Base):
     filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
     file_size = Column(BigInteger, nullable=False)  # Size in bytes
-    file_hash = Column(String(64), nullable=True, index=True)  # SHA-256 hash
+    file_hash = Column(HexDigest, nullable=True)  # SHA-256 digest
     content_type = Column(String(100), nullable=False, default="application/pdf")
     
     # Version control
@@ -69,7 +110,7 @@ class Policy(Base):
     jurisdiction = Column(String(100), nullable=True)  # e.g., "India", "Karnataka", "Bangalore"
     
     # Classification
-    policy_type = Column(SQLEnum(PolicyType), nullable=True, index=True)
+    policy_type = Column(_enum_column(PolicyType, "ck_policy_type"), nullable=True, index=True)
     
     # Dates
     effective_date = Column(DateTime, nullable=True)
@@ -81,12 +122,16 @@ class Policy(Base):
     # Flexible metadata storage
     metadata_json = Column(JSON, nullable=True)
     
-    # Full-text search (simplified for SQLite)
-    search_vector = Column(Text, nullable=True)
+    # Full-text search: kept in sync by PostgreSQL itself (a NULL placeholder
+    # elsewhere). Only searched on, never read back: left out of SELECT policies
+    search_vector = deferred(Column(
+        Text().with_variant(TSVECTOR(), "postgresql"),
+        Computed(search_document(), persisted=True)
+    ))
     
     # Status tracking
     status = Column(
-        SQLEnum(PolicyStatus), 
+        _enum_column(PolicyStatus, "ck_policy_status"), 
         nullable=False, 
         default=PolicyStatus.UPLOADED,
         index=True
@@ -96,8 +141,8 @@ class Policy(Base):
     uploaded_by_id = Column(Integer, nullable=True)  # Foreign key to users table
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
+    updated_at = Column(DateTime, nullable=False, default=sql_utcnow(), onupdate=sql_utcnow())
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
     
     # Relationships
@@ -122,9 +167,40 @@ class Policy(Base):
     # Indexes
     __table_args__ = (
         Index('idx_policy_status_type', 'status', 'policy_type'),
-        Index('idx_policy_created_at', 'created_at'),
         Index('idx_policy_jurisdiction', 'jurisdiction'),
+        # Keyset pagination for listings: seek on (created_at, id) among live rows
+        Index('idx_policy_list_keyset', 'deleted_at', created_at.desc(), id.desc()),
+        # Same ordering for status/type-filtered listings, live rows only
+        Index(
+            'idx_policy_live_status_created', 'status', created_at.desc(), id.desc(),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            'idx_policy_live_policy_type_created', 'policy_type', created_at.desc(), id.desc(),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # At most one live policy per content hash; lets uploads dedupe via ON CONFLICT
+        Index(
+            'ux_policy_live_hash', 'file_hash',
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # The rest of the hashes, for reusing a soft-deleted copy's extraction;
+        # each row is in exactly one of the two hash indexes
+        Index(
+            'idx_policy_deleted_hash', 'file_hash',
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+        Index(
+            'idx_policy_search_vector', 'search_vector', postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
     )
+    # Fetch generated columns via INSERT ... RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<Policy(id={self.id}, policy_id={self.policy_id}, title={self.title})>"
@@ -150,7 +226,9 @@ class PolicyCategory(Base):
     color = Column(String(7), nullable=True)  # Hex color code
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
+    
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<PolicyCategory(id={self.id}, name={self.name})>"
@@ -168,7 +246,9 @@ class PolicyTag(Base):
     color = Column(String(7), nullable=True)  # Hex color code
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
+    
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<PolicyTag(id={self.id}, name={self.name})>"
@@ -201,18 +281,23 @@ class PolicyProcessing(Base):
     policy_id = Column(Integer, ForeignKey("policies.id", ondelete="CASCADE"), nullable=False)
     
     # Processing stage information
-    stage = Column(SQLEnum(ProcessingStage), nullable=False)
-    status = Column(SQLEnum(ProcessingStatus), nullable=False, default=ProcessingStatus.PENDING)
+    stage = Column(_enum_column(ProcessingStage, "ck_processing_stage"), nullable=False)
+    status = Column(
+        _enum_column(ProcessingStatus, "ck_processing_status"), nullable=False, default=ProcessingStatus.PENDING
+    )
     progress_percent = Column(Integer, nullable=False, default=0)  # 0-100
     
     # Results and errors
     result_data = Column(JSON, nullable=True)  # Store stage-specific results
+    # Full text of a text_extraction record, kept out of result_data so the
+    # JSON stays small; deferred so loading a record does not pull it in
+    extracted_text = deferred(Column(Text, nullable=True))
     error_message = Column(Text, nullable=True)
     
     # Timestamps
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
     
     # Relationships
     policy = relationship("Policy", back_populates="processing_records")
@@ -222,6 +307,7 @@ class PolicyProcessing(Base):
         Index('idx_processing_policy_stage', 'policy_id', 'stage'),
         Index('idx_processing_status', 'status'),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<PolicyProcessing(id={self.id}, policy_id={self.policy_id}, stage={self.stage}, status={self.status})>"
@@ -258,7 +344,7 @@ class PolicyChunk(Base):
     embedding = Column(JSON, nullable=True)
     
     # Timestamp
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
     
     # Relationships
     policy = relationship("Policy", back_populates="chunks")
@@ -268,6 +354,7 @@ class PolicyChunk(Base):
         Index('idx_chunk_policy_index', 'policy_id', 'chunk_index'),
         Index('idx_chunk_policy', 'policy_id'),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<PolicyChunk(id={self.id}, policy_id={self.policy_id}, chunk_index={self.chunk_index}, size={self.chunk_size})>"
@@ -292,18 +379,18 @@ class PolicyVersion(Base):
     description = Column(Text, nullable=True)
     language = Column(String(10), nullable=True)
     jurisdiction = Column(String(100), nullable=True)
-    policy_type = Column(SQLEnum(PolicyType), nullable=True)
+    policy_type = Column(_enum_column(PolicyType, "ck_policy_version_type"), nullable=True)
     effective_date = Column(DateTime, nullable=True)
     expiry_date = Column(DateTime, nullable=True)
     source_url = Column(String(500), nullable=True)
-    status = Column(SQLEnum(PolicyStatus), nullable=True)
+    status = Column(_enum_column(PolicyStatus, "ck_policy_version_status"), nullable=True)
 
     # Who made the change and why (optional, for future auth integration)
     changed_by = Column(String(255), nullable=True)
     change_reason = Column(Text, nullable=True)
 
     # When this snapshot was created
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=sql_utcnow())
 
     # Relationship back to the live policy
     policy = relationship("Policy", back_populates="versions")
@@ -313,6 +400,7 @@ class PolicyVersion(Base):
         Index("idx_policy_version_policy_id", "policy_id"),
         Index("idx_policy_version_number", "policy_id", "version_number", unique=True),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self) -> str:
         return f"<PolicyVersion(id={self.id}, policy_id={self.policy_id}, version_number={self.version_number})>"
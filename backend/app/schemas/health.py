@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict
 
 
@@ -10,8 +10,8 @@ class HealthResponse(BaseModel):
     version: str
     environment: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "app_name": "CivicLens AI",
@@ -19,3 +19,4 @@ class HealthResponse(BaseModel):
                 "environment": "development"
             }
         }
+    )
@@ -2,9 +2,10 @@
 Pydantic schemas for policy API endpoints.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, Strict
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import Annotated, Any, Literal, Optional, List, Tuple, Type, TypeVar
 from enum import Enum
 
 
@@ -31,6 +32,25 @@ class PolicyStatusEnum(str, Enum):
     ARCHIVED = "archived"
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def from_orm_fast(schema: Type[ModelT], obj: Any) -> ModelT:
+    """
+    Build a response schema from an ORM row without running its validators.
+    
+    The row's columns already satisfy the schema, so model_construct copies
+    the attributes over as they are. Never use this for untrusted data
+    (request bodies, client-supplied dicts); those go through model_validate.
+    """
+    return schema.model_construct(**{name: getattr(obj, name) for name in _field_names(schema)})
+
+
 # Base schemas
 class PolicyBase(BaseModel):
     """Base policy schema with common fields."""
@@ -172,20 +192,29 @@ class PolicyUploadResponse(BaseModel):
 class PolicyListResponse(BaseModel):
     """Response for policy list endpoint."""
     policies: List[PolicyPublic]
-    total: int
+    total: Optional[int] = Field(None, description="Total matching policies (omitted for cursor pages)")
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
+
+
+# Enum values as Literals, validated by pydantic-core without a Python
+# enum lookup; built from the enums so the two never drift apart
+PolicyStatusLiteral = Literal[tuple(member.value for member in PolicyStatusEnum)]
+PolicyTypeLiteral = Literal[tuple(member.value for member in PolicyTypeEnum)]
 
 
 class PolicyFilter(BaseModel):
     """Query parameters for filtering policies."""
-    status: Optional[PolicyStatusEnum] = None
-    policy_type: Optional[PolicyTypeEnum] = None
-    jurisdiction: Optional[str] = None
-    language: Optional[str] = None
-    search: Optional[str] = Field(None, description="Full-text search query")
+    status: Optional[PolicyStatusLiteral] = None
+    policy_type: Optional[PolicyTypeLiteral] = None
+    jurisdiction: Optional[Annotated[str, Strict(), Field(max_length=100)]] = None
+    language: Optional[Annotated[str, Strict(), Field(max_length=10)]] = None
+    search: Optional[Annotated[str, Strict(), Field(max_length=256)]] = Field(None, description="Full-text search query")
     limit: int = Field(default=20, ge=1, le=100, description="Number of results per page")
     offset: int = Field(default=0, ge=0, description="Number of results to skip")
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class PolicyMetadata(BaseModel):
@@ -224,7 +253,7 @@ class ExtractedTextResponse(BaseModel):
     """Response for retrieved extracted text."""
     policy_id: str = Field(..., description="Unique policy identifier")
     filename: str = Field(..., description="Original filename")
-    extracted_text: str = Field(..., description="Full extracted text content")
+    extracted_text: Optional[str] = Field(None, description="Full extracted text content (omitted when metadata_only)")
     character_count: int = Field(..., description="Number of characters")
     word_count: int = Field(..., description="Number of words")
     extraction_timestamp: datetime = Field(..., description="When text was extracted")
@@ -2,7 +2,7 @@
 Pydantic schemas for RAG (Retrieval-Augmented Generation) endpoints.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import List, Optional
 from datetime import datetime
 
@@ -59,8 +59,8 @@ class RAGQueryRequest(BaseModel):
             raise ValueError("query must not be blank or whitespace-only")
         return stripped
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "What are the income requirements for this housing program?",
                 "policy_id": "pol_abc123",
@@ -69,6 +69,7 @@ class RAGQueryRequest(BaseModel):
                 "language": "en"
             }
         }
+    )
 
 
 class SourceChunk(BaseModel):
@@ -114,8 +115,8 @@ class RAGResponse(BaseModel):
     cached: Optional[bool] = Field(None, description="Whether this response was served from cache")
 
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "answer": "The income requirements for this housing program are...",
                 "sources": [
@@ -151,6 +152,7 @@ class RAGResponse(BaseModel):
                 "cached": False
             }
         }
+    )
 
 
 class RAGStreamChunk(BaseModel):
@@ -163,8 +165,8 @@ class RAGStreamChunk(BaseModel):
     done: Optional[bool] = Field(None, description="Whether streaming is complete (for answer type)")
     evaluation: Optional[EvaluationMetrics] = Field(None, description="Evaluation metrics (for evaluation type)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "type": "sources",
@@ -191,3 +193,4 @@ class RAGStreamChunk(BaseModel):
                 }
             ]
         }
+    )
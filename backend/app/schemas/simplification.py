@@ -2,7 +2,7 @@
 Pydantic schemas for policy simplification endpoints.
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from typing import Optional, List, Any
 from datetime import datetime
 from enum import Enum
@@ -85,8 +85,8 @@ class SimplificationRequest(BaseModel):
         examples=["20 years old, full-time college student with part-time job", "65+ years old, retired, living on fixed income"]
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "policy_id": "pol_abc123",
@@ -104,6 +104,7 @@ class SimplificationRequest(BaseModel):
                 }
             ]
         }
+    )
 
     @field_validator("policy_id")
     @classmethod
@@ -167,8 +168,8 @@ class SimplificationResponse(BaseModel):
         description="Original timestamp when cached response was generated"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "policy_id": "pol_abc123",
                 "policy_title": "Affordable Housing Policy 2024",
@@ -180,3 +181,4 @@ class SimplificationResponse(BaseModel):
                 "response_language": "en"
             }
         }
+    )
@@ -237,8 +237,7 @@ async def process_policy_embeddings(
             stage=ProcessingStage.EMBEDDING,
             status=ProcessingStatus.IN_PROGRESS,
             progress_percent=0,
-            started_at=datetime.utcnow(),
-            created_at=datetime.utcnow()
+            started_at=datetime.utcnow()
         )
         db.add(processing_record)
     else:
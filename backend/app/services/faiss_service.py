@@ -269,19 +269,12 @@ class FAISSIndexManager:
         """
         try:
             # Remove from memory
-            if policy_id in self.indices:
-                del self.indices[policy_id]
-            if policy_id in self.id_maps:
-                del self.id_maps[policy_id]
-            
-            # Remove from disk
-            index_path = self._get_index_path(policy_id)
-            id_map_path = self._get_id_map_path(policy_id)
+            self.indices.pop(policy_id, None)
+            self.id_maps.pop(policy_id, None)
             
-            if index_path.exists():
-                index_path.unlink()
-            if id_map_path.exists():
-                id_map_path.unlink()
+            # Remove from disk; one unlink per file instead of stat + unlink
+            self._get_index_path(policy_id).unlink(missing_ok=True)
+            self._get_id_map_path(policy_id).unlink(missing_ok=True)
             
             logger.info(f"Deleted FAISS index for policy {policy_id}")
             
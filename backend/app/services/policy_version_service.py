@@ -5,10 +5,9 @@ Handles metadata updates, version history snapshots, and restoration of past ver
 
 import logging
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, bindparam
 from fastapi import HTTPException, status
 
 from app.models.policy import Policy, PolicyVersion, PolicyStatus
@@ -17,6 +16,19 @@ from app.core.exceptions import CivicLensException
 
 logger = logging.getLogger(__name__)
 
+# Lookups built once at import; values are bound per call
+_SELECT_LIVE_POLICY = select(Policy).where(
+    Policy.policy_id == bindparam("policy_id"),
+    Policy.deleted_at.is_(None)
+)
+_SELECT_POLICY_VERSIONS = select(PolicyVersion).where(
+    PolicyVersion.policy_id == bindparam("policy_pk")
+).order_by(desc(PolicyVersion.version_number))
+_SELECT_POLICY_VERSION = select(PolicyVersion).where(
+    PolicyVersion.policy_id == bindparam("policy_pk"),
+    PolicyVersion.version_number == bindparam("version_number")
+)
+
 
 class PolicyVersionError(CivicLensException):
     """Exception raised when policy versioning operations fail."""
@@ -40,8 +52,7 @@ async def update_policy_metadata(
     4. Policy is updated with new data and version becomes 2.
     """
     # Get policy
-    stmt = select(Policy).where(Policy.policy_id == policy_id, Policy.deleted_at.is_(None))
-    result = await db.execute(stmt)
+    result = await db.execute(_SELECT_LIVE_POLICY, {"policy_id": policy_id})
     policy = result.scalar_one_or_none()
     
     if not policy:
@@ -73,8 +84,7 @@ async def update_policy_metadata(
         source_url=policy.source_url,
         status=policy.status,
         changed_by=changed_by,
-        change_reason=change_reason,
-        created_at=datetime.utcnow()
+        change_reason=change_reason
     )
     db.add(snapshot)
     
@@ -83,12 +93,10 @@ async def update_policy_metadata(
         if hasattr(policy, key):
             setattr(policy, key, value)
     
-    # Bump version and update timestamp
+    # Bump version; updated_at is stamped by the database on UPDATE
     policy.version += 1
-    policy.updated_at = datetime.utcnow()
     
     await db.commit()
-    await db.refresh(policy)
     
     logger.info(f"Updated policy {policy_id} to version {policy.version}")
     return policy
@@ -100,8 +108,7 @@ async def list_policy_versions(
 ) -> List[PolicyVersion]:
     """Retrieve all historical snapshots for a policy."""
     # Get policy first to verify existence
-    stmt = select(Policy).where(Policy.policy_id == policy_id, Policy.deleted_at.is_(None))
-    result = await db.execute(stmt)
+    result = await db.execute(_SELECT_LIVE_POLICY, {"policy_id": policy_id})
     policy = result.scalar_one_or_none()
     
     if not policy:
@@ -111,11 +118,7 @@ async def list_policy_versions(
         )
     
     # Get versions ordered by version_number desc
-    v_stmt = select(PolicyVersion).where(
-        PolicyVersion.policy_id == policy.id
-    ).order_by(desc(PolicyVersion.version_number))
-    
-    v_result = await db.execute(v_stmt)
+    v_result = await db.execute(_SELECT_POLICY_VERSIONS, {"policy_pk": policy.id})
     return list(v_result.scalars().all())
 
 
@@ -125,8 +128,7 @@ async def get_policy_version(
     db: AsyncSession
 ) -> PolicyVersion:
     """Retrieve a specific historical snapshot."""
-    stmt = select(Policy).where(Policy.policy_id == policy_id, Policy.deleted_at.is_(None))
-    result = await db.execute(stmt)
+    result = await db.execute(_SELECT_LIVE_POLICY, {"policy_id": policy_id})
     policy = result.scalar_one_or_none()
     
     if not policy:
@@ -135,11 +137,10 @@ async def get_policy_version(
              status_code=status.HTTP_404_NOT_FOUND
         )
     
-    v_stmt = select(PolicyVersion).where(
-        PolicyVersion.policy_id == policy.id,
-        PolicyVersion.version_number == version_number
+    v_result = await db.execute(
+        _SELECT_POLICY_VERSION,
+        {"policy_pk": policy.id, "version_number": version_number}
     )
-    v_result = await db.execute(v_stmt)
     version = v_result.scalar_one_or_none()
     
     if not version:
@@ -161,8 +162,7 @@ async def restore_policy_version(
     This creates a snapshot of the current state before overwriting.
     """
     # Get current policy
-    stmt = select(Policy).where(Policy.policy_id == policy_id, Policy.deleted_at.is_(None))
-    result = await db.execute(stmt)
+    result = await db.execute(_SELECT_LIVE_POLICY, {"policy_id": policy_id})
     policy = result.scalar_one_or_none()
     
     if not policy:
@@ -172,11 +172,10 @@ async def restore_policy_version(
         )
     
     # Get the version to restore from
-    v_stmt = select(PolicyVersion).where(
-        PolicyVersion.policy_id == policy.id,
-        PolicyVersion.version_number == version_number
+    v_result = await db.execute(
+        _SELECT_POLICY_VERSION,
+        {"policy_pk": policy.id, "version_number": version_number}
     )
-    v_result = await db.execute(v_stmt)
     version_data = v_result.scalar_one_or_none()
     
     if not version_data:
@@ -200,8 +199,7 @@ async def restore_policy_version(
         source_url=policy.source_url,
         status=policy.status,
         changed_by="system",
-        change_reason=f"Restored from version {version_number}",
-        created_at=datetime.utcnow()
+        change_reason=f"Restored from version {version_number}"
     )
     db.add(snapshot)
     
@@ -216,12 +214,10 @@ async def restore_policy_version(
     policy.source_url = version_data.source_url
     policy.status = version_data.status
     
-    # Bump version
+    # Bump version; updated_at is stamped by the database on UPDATE
     policy.version += 1
-    policy.updated_at = datetime.utcnow()
     
     await db.commit()
-    await db.refresh(policy)
     
     logger.info(f"Restored policy {policy_id} to version {version_number} (new version is {policy.version})")
     return policy
@@ -248,20 +248,18 @@ async def get_policy_text(policy_id: str, db: AsyncSession) -> tuple[str, Option
     
     # Fallback: Try to get from text extraction processing record
     processing_result = await db.execute(
-        select(PolicyProcessing)
+        select(PolicyProcessing.extracted_text)
         .where(
             PolicyProcessing.policy_id == policy.id,
             PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION,
             PolicyProcessing.status == ProcessingStatus.COMPLETED
         )
     )
-    processing = processing_result.scalar_one_or_none()
+    extracted_text = processing_result.scalar_one_or_none()
     
-    if processing and processing.result_data:
-        extracted_text = processing.result_data.get("extracted_text")
-        if extracted_text:
-            logger.info(f"Retrieved extracted text for policy {policy_id}")
-            return extracted_text, policy_title
+    if extracted_text:
+        logger.info(f"Retrieved extracted text for policy {policy_id}")
+        return extracted_text, policy_title
     
     # No text available
     raise SimplificationError(
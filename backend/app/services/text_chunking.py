@@ -219,22 +219,22 @@ async def process_policy_chunking(
             details={"policy_id": policy_id}
         )
     
-    # Get extracted text from processing record
-    text_proc_stmt = select(PolicyProcessing).where(
+    # Get extracted text from the completed extraction record
+    text_proc_stmt = select(PolicyProcessing.id, PolicyProcessing.extracted_text).where(
         PolicyProcessing.policy_id == policy.id,
         PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION,
         PolicyProcessing.status == ProcessingStatus.COMPLETED
     )
     text_proc_result = await db.execute(text_proc_stmt)
-    text_processing = text_proc_result.scalar_one_or_none()
+    text_processing = text_proc_result.one_or_none()
     
-    if not text_processing or not text_processing.result_data:
+    if text_processing is None:
         raise ChunkingError(
             "Cannot chunk: text not extracted yet",
             details={"policy_id": policy_id}
         )
     
-    extracted_text = text_processing.result_data.get("extracted_text")
+    extracted_text = text_processing.extracted_text
     if not extracted_text:
         raise ChunkingError(
             "No extracted text found",
@@ -269,8 +269,7 @@ async def process_policy_chunking(
             stage=ProcessingStage.CHUNKING,
             status=ProcessingStatus.IN_PROGRESS,
             progress_percent=0,
-            started_at=datetime.utcnow(),
-            created_at=datetime.utcnow()
+            started_at=datetime.utcnow()
         )
         db.add(processing_record)
     else:
@@ -303,8 +302,7 @@ async def process_policy_chunking(
                 start_char=chunk.start_char,
                 end_char=chunk.end_char,
                 page_numbers=None,  # TODO: Map to page numbers if available
-                metadata_json=chunk.metadata,
-                created_at=datetime.utcnow()
+                metadata_json=chunk.metadata
             )
             db_chunks.append(db_chunk)
         
@@ -3,21 +3,100 @@ Text extraction service for policy documents.
 Handles PDF text extraction and processing pipeline integration.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional
 from datetime import datetime
+import asyncio
+import io
 import logging
+import mmap
+import multiprocessing
+import os
+import threading
+
+from pypdf import PageObject, PdfReader
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:  # Optional fast path; pypdf handles everything without it
+    pdfium = None
 
-from pypdf import PdfReader
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam, and_, Row
 
 from app.models.policy import Policy, PolicyProcessing, ProcessingStage, ProcessingStatus
 from app.core.exceptions import CivicLensException
+from app.constants import PDF_PARALLEL_MIN_PAGES, PDF_PAGES_PER_TASK, PDF_EXTRACTION_WORKERS
 
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; the policy_id is bound per call. The outer join
+# fetches the policy and its text extraction record (if any) together.
+_SELECT_LIVE_POLICY_WITH_EXTRACTION = (
+    select(Policy, PolicyProcessing)
+    .outerjoin(PolicyProcessing, and_(
+        PolicyProcessing.policy_id == Policy.id,
+        PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION
+    ))
+    .where(
+        Policy.policy_id == bindparam("policy_id"),
+        Policy.deleted_at.is_(None)
+    )
+)
+# A completed extraction of another policy with identical file contents, so
+# re-uploads reuse its text. Live hashes are unique, so any other policy
+# holding the hash has been soft-deleted; saying so lets idx_policy_deleted_hash
+# serve the lookup
+_SELECT_EXTRACTION_BY_FILE_HASH = (
+    select(PolicyProcessing.extracted_text, PolicyProcessing.result_data)
+    .join(Policy, Policy.id == PolicyProcessing.policy_id)
+    .where(
+        Policy.file_hash == bindparam("file_hash"),
+        Policy.deleted_at.is_not(None),
+        Policy.id != bindparam("policy_pk"),
+        PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION,
+        PolicyProcessing.status == ProcessingStatus.COMPLETED,
+        PolicyProcessing.extracted_text.is_not(None)
+    )
+    .limit(1)
+)
+# Fields of the completed extraction result; the counts are pulled out of
+# the JSON column by the database so callers never re-count the document
+_RESULT_EXTRACTED_TEXT = PolicyProcessing.extracted_text
+_RESULT_CHARACTER_COUNT = PolicyProcessing.result_data["character_count"].as_integer().label("character_count")
+_RESULT_WORD_COUNT = PolicyProcessing.result_data["word_count"].as_integer().label("word_count")
+
+
+def _select_live_policy_text(*result_columns):
+    """Select the filename plus extraction result fields for a live policy.
+    
+    The outer join keeps the policy row when nothing has been extracted yet.
+    """
+    return (
+        select(Policy.filename, *result_columns)
+        .outerjoin(PolicyProcessing, and_(
+            PolicyProcessing.policy_id == Policy.id,
+            PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION,
+            PolicyProcessing.status == ProcessingStatus.COMPLETED
+        ))
+        .where(
+            Policy.policy_id == bindparam("policy_id"),
+            Policy.deleted_at.is_(None)
+        )
+    )
+
+
+_SELECT_LIVE_POLICY_TEXT = _select_live_policy_text(
+    _RESULT_EXTRACTED_TEXT, _RESULT_CHARACTER_COUNT, _RESULT_WORD_COUNT
+)
+_SELECT_LIVE_POLICY_TEXT_STATS = _select_live_policy_text(
+    _RESULT_CHARACTER_COUNT, _RESULT_WORD_COUNT
+)
 
 class TextExtractionError(CivicLensException):
     """Exception raised when text extraction fails."""
@@ -30,31 +109,146 @@ class TextExtractionError(CivicLensException):
         )
 
 
-def extract_text_from_pdf(file_path: Path) -> str:
+# Content stream operators that show text; a page without any of them has
+# nothing for extract_text() to find
+_TEXT_SHOWING_OPERATORS = (b"Tj", b"TJ", b"'", b'"')
+
+
+class PdfExtraction(NamedTuple):
+    """Text pulled from a PDF plus what was left for OCR."""
+    text: str
+    total_pages: int
+    image_only_pages: List[int]  # 1-based numbers of scanned/image-only pages
+
+
+class _PdfPages(NamedTuple):
+    """Per-page extraction result of one PDF backend."""
+    text: str  # Non-empty page texts in page order, separated by blank lines
+    total_pages: int
+    image_only_pages: List[int]
+
+
+def _write_page(buffer: io.StringIO, page_text: str) -> None:
     """
-    Extract raw text content from a PDF file.
+    Append a page's text to the document buffer, after a blank line.
+    
+    Pages go straight into the buffer instead of a list joined at the end,
+    so each page string is released as soon as it is written.
+    """
+    if buffer.tell():
+        buffer.write("\n\n")
+    buffer.write(page_text)
+
+
+def _is_image_only(page: PageObject) -> bool:
+    """
+    Cheap pre-check for scanned pages: image XObjects and no text operators.
+    
+    Scans the decoded content stream bytes instead of running pypdf's
+    content stream interpreter. Pages drawing form XObjects are never
+    treated as image-only, since a form can carry text of its own.
+    """
+    resources = page["/Resources"] if "/Resources" in page else None
+    if resources is None or "/XObject" not in resources:
+        return False
+    xobjects = resources["/XObject"]
+    if not xobjects or any(xobjects[name]["/Subtype"] != "/Image" for name in xobjects):
+        return False
+    contents = page.get_contents()
+    if contents is None:
+        return False
+    raw = contents.get_data()
+    return not any(op in raw for op in _TEXT_SHOWING_OPERATORS)
+
+
+def _extract_pages_pdfium(file_path: Path, start: int = 0, stop: Optional[int] = None) -> Optional[_PdfPages]:
+    """
+    Extract per-page text with PDFium (C++), much faster than pypdf.
     
     Args:
         file_path: Path to the PDF file
-        
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract (default: all pages)
+    
     Returns:
-        str: Extracted text content
-        
-    Raises:
-        TextExtractionError: If extraction fails
+        Extracted pages, or None when PDFium is not installed or cannot
+        open the document (e.g. it is encrypted)
     """
+    if pdfium is None:
+        return None
     try:
-        logger.info(f"Starting text extraction from: {file_path}")
-        
-        if not file_path.exists():
-            raise TextExtractionError(
-                message="PDF file not found",
-                details={"file_path": str(file_path)}
-            )
-        
-        # Read PDF and extract text
-        reader = PdfReader(str(file_path))
+        pdf = pdfium.PdfDocument(str(file_path))
+    except pdfium.PdfiumError as e:
+        logger.debug("PDFium could not open %s: %s", file_path, e)
+        return None
+    
+    try:
+        text_content = io.StringIO()
+        image_only_pages = []
+        total_pages = len(pdf)
+        for page_num in range(start, total_pages if stop is None else min(stop, total_pages)):
+            try:
+                page = pdf[page_num]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                    # No text but images drawn: a scan, left for OCR
+                    if not page_text.strip() and any(
+                        page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE])
+                    ):
+                        image_only_pages.append(page_num + 1)
+                finally:
+                    page.close()
+                if page_text:
+                    # PDFium ends lines with CRLF; match pypdf's output
+                    _write_page(text_content, page_text.replace("\r\n", "\n"))
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page {page_num + 1}: {str(e)}")
+                # Continue with other pages even if one fails
+                continue
+        return _PdfPages(text_content.getvalue(), total_pages, image_only_pages)
+    finally:
+        pdf.close()
+
+
+@contextmanager
+def _mapped_pdf_reader(file_path: Path) -> Iterator[PdfReader]:
+    """
+    Open a PdfReader over a read-only memory map of the file.
+    
+    Given a path, pypdf reads the whole file into a BytesIO first. Reading
+    from the map instead serves pypdf straight from the page cache, which
+    every process extracting from the same document shares, and the kernel
+    can drop the pages again under memory pressure.
+    """
+    with open(file_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            # mmap rejects empty files; let pypdf report the empty file
+            yield PdfReader(f)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PdfReader(mapped)
+
+
+def _extract_pages_pypdf(file_path: Path, start: int = 0, stop: Optional[int] = None) -> _PdfPages:
+    """
+    Extract per-page text with pypdf.
+    
+    Args:
+        file_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract (default: all pages)
+    
+    Returns:
+        Extracted pages
         
+    Raises:
+        TextExtractionError: If the PDF is encrypted
+    """
+    with _mapped_pdf_reader(file_path) as reader:
         # Check if PDF is encrypted
         if reader.is_encrypted:
             raise TextExtractionError(
@@ -63,34 +257,184 @@ def extract_text_from_pdf(file_path: Path) -> str:
             )
         
         # Extract text from all pages
-        text_content = []
+        text_content = io.StringIO()
+        image_only_pages = []
         total_pages = len(reader.pages)
         
-        logger.debug(f"Extracting text from {total_pages} pages")
+        stop = total_pages if stop is None else min(stop, total_pages)
         
-        for page_num, page in enumerate(reader.pages, start=1):
+        logger.debug("Extracting text from pages %d-%d of %d", start + 1, stop, total_pages)
+        
+        for page_num in range(start + 1, stop + 1):
             try:
+                page = reader.pages[page_num - 1]
+                # Scanned pages have no text to find; skip the interpreter
+                if _is_image_only(page):
+                    image_only_pages.append(page_num)
+                    logger.debug("Skipped image-only page %d/%d", page_num, total_pages)
+                    continue
                 page_text = page.extract_text()
                 if page_text:
-                    text_content.append(page_text)
-                logger.debug(f"Extracted text from page {page_num}/{total_pages}")
+                    _write_page(text_content, page_text)
+                logger.debug("Extracted text from page %d/%d", page_num, total_pages)
             except Exception as e:
                 logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
                 # Continue with other pages even if one fails
                 continue
         
-        # Combine all text
-        full_text = "\n\n".join(text_content)
+        return _PdfPages(text_content.getvalue(), total_pages, image_only_pages)
+
+
+def _extract_page_range(file_path: Path, start: int = 0, stop: Optional[int] = None) -> _PdfPages:
+    """Extract pages [start, stop) with PDFium, falling back to pypdf if it finds no text."""
+    pages = _extract_pages_pdfium(file_path, start, stop)
+    if pages is None or not pages.text:
+        pages = _extract_pages_pypdf(file_path, start, stop)
+    return pages
+
+
+def _count_pages(file_path: Path) -> int:
+    """
+    Page count of a PDF, without extracting anything.
+    
+    Raises:
+        TextExtractionError: If the PDF is encrypted
+    """
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(str(file_path))
+        except pdfium.PdfiumError:
+            pass  # pypdf below reports encryption with a proper error
+        else:
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    with _mapped_pdf_reader(file_path) as reader:
+        if reader.is_encrypted:
+            raise TextExtractionError(
+                message="PDF is encrypted and cannot be processed",
+                details={"file_path": str(file_path)}
+            )
+        return len(reader.pages)
+
+
+# Worker processes for long documents, started on first use and kept for
+# the life of the app. Spawned rather than forked: the app process runs
+# threads (asyncio.to_thread workers, the logging listener) that a fork
+# could catch holding a lock.
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _page_pool
+
+
+def shutdown_page_pool() -> None:
+    """Stop the page extraction worker processes, if any were started."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=True, cancel_futures=True)
+            _page_pool = None
+
+
+def _extract_pages_parallel(file_path: Path) -> Optional[_PdfPages]:
+    """
+    Extract a long document's pages on the worker pool, in ranges of pages.
+    
+    Text extraction is CPU bound and pypdf holds the GIL, so pages are
+    spread across processes; each task covers PDF_PAGES_PER_TASK pages so
+    the per-task overhead is amortised.
+    
+    Returns:
+        Merged pages in document order, or None if the document is too
+        short to be worth it or the pool failed (the caller then extracts
+        serially)
         
-        if not full_text.strip():
+    Raises:
+        TextExtractionError: If the PDF is encrypted
+    """
+    global _page_pool
+    if PDF_EXTRACTION_WORKERS < 2:
+        return None
+    total_pages = _count_pages(file_path)
+    if total_pages < PDF_PARALLEL_MIN_PAGES:
+        return None
+    
+    starts = range(0, total_pages, PDF_PAGES_PER_TASK)
+    stops = [start + PDF_PAGES_PER_TASK for start in starts]
+    try:
+        ranges = list(_get_page_pool().map(_extract_page_range, repeat(file_path), starts, stops))
+    except Exception as e:
+        logger.warning(f"Parallel extraction failed for {file_path}, extracting serially: {str(e)}")
+        with _page_pool_lock:
+            # A crashed worker leaves the pool unusable; start a fresh one next time
+            if _page_pool is not None and getattr(_page_pool, "_broken", False):
+                _page_pool.shutdown(wait=False)
+                _page_pool = None
+        return None
+    
+    return _PdfPages(
+        "\n\n".join(pages.text for pages in ranges if pages.text),
+        total_pages,
+        [page for pages in ranges for page in pages.image_only_pages]
+    )
+
+
+def extract_pdf(file_path: Path) -> PdfExtraction:
+    """
+    Extract raw text content from a PDF file, noting image-only pages.
+    
+    PDFium is used when installed; pypdf handles documents PDFium cannot
+    open or finds no text in, and reports encrypted files.
+    
+    Args:
+        file_path: Path to the PDF file
+        
+    Returns:
+        PdfExtraction: Extracted text, page count and image-only pages
+        
+    Raises:
+        TextExtractionError: If extraction fails
+    """
+    try:
+        logger.info(f"Starting text extraction from: {file_path}")
+        
+        if not file_path.exists():
+            raise TextExtractionError(
+                message="PDF file not found",
+                details={"file_path": str(file_path)}
+            )
+        
+        pages = _extract_pages_parallel(file_path) or _extract_page_range(file_path)
+        
+        full_text = pages.text.strip()
+        
+        if not full_text:
             raise TextExtractionError(
                 message="No text content found in PDF",
-                details={"file_path": str(file_path), "pages": total_pages}
+                details={
+                    "file_path": str(file_path),
+                    "pages": pages.total_pages,
+                    "image_only_pages": len(pages.image_only_pages)
+                }
             )
         
-        logger.info(f"Successfully extracted {len(full_text)} characters from {total_pages} pages")
+        logger.info(
+            f"Successfully extracted {len(full_text)} characters from {pages.total_pages} pages"
+            f" ({len(pages.image_only_pages)} image-only)"
+        )
         
-        return full_text.strip()
+        return PdfExtraction(full_text, pages.total_pages, pages.image_only_pages)
         
     except TextExtractionError:
         raise
@@ -102,6 +446,22 @@ def extract_text_from_pdf(file_path: Path) -> str:
         )
 
 
+def extract_text_from_pdf(file_path: Path) -> str:
+    """
+    Extract raw text content from a PDF file.
+    
+    Args:
+        file_path: Path to the PDF file
+        
+    Returns:
+        str: Extracted text content
+        
+    Raises:
+        TextExtractionError: If extraction fails
+    """
+    return extract_pdf(file_path).text
+
+
 async def process_policy_text_extraction(
     policy_id: str,
     db: AsyncSession,
@@ -124,27 +484,16 @@ async def process_policy_text_extraction(
     """
     logger.info(f"Processing text extraction for policy: {policy_id}")
     
-    # Get policy from database
-    stmt = select(Policy).where(
-        Policy.policy_id == policy_id,
-        Policy.deleted_at.is_(None)
-    )
-    result = await db.execute(stmt)
-    policy = result.scalar_one_or_none()
+    # Get the policy and any existing processing record in one round trip
+    result = await db.execute(_SELECT_LIVE_POLICY_WITH_EXTRACTION, {"policy_id": policy_id})
+    row = result.one_or_none()
     
-    if not policy:
+    if row is None:
         raise TextExtractionError(
             message=f"Policy not found: {policy_id}",
             details={"policy_id": policy_id}
         )
-    
-    # Check for existing processing record
-    proc_stmt = select(PolicyProcessing).where(
-        PolicyProcessing.policy_id == policy.id,
-        PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION
-    )
-    proc_result = await db.execute(proc_stmt)
-    processing_record = proc_result.scalar_one_or_none()
+    policy, processing_record = row
     
     # Check if already extracted (unless force=True)
     if processing_record and not force:
@@ -166,8 +515,7 @@ async def process_policy_text_extraction(
             stage=ProcessingStage.TEXT_EXTRACTION,
             status=ProcessingStatus.IN_PROGRESS,
             progress_percent=0,
-            started_at=datetime.utcnow(),
-            created_at=datetime.utcnow()
+            started_at=datetime.utcnow()
         )
         db.add(processing_record)
     else:
@@ -177,31 +525,54 @@ async def process_policy_text_extraction(
         processing_record.started_at = datetime.utcnow()
         processing_record.error_message = None
         processing_record.result_data = None
-    
-    await db.commit()
-    await db.refresh(processing_record)
+        processing_record.extracted_text = None
     
     try:
-        # Extract text from PDF
+        # Identical contents extract to identical text, and every upload
+        # stores its hash, so an extraction of the same file can be reused
         file_path = Path(policy.file_path)
-        extracted_text = extract_text_from_pdf(file_path)
-        
-        # Store result
-        result_data = {
-            "extracted_text": extracted_text,
-            "character_count": len(extracted_text),
-            "word_count": len(extracted_text.split()),
-            "extraction_timestamp": datetime.utcnow().isoformat()
-        }
+        
+        # force re-extracts from the file even when a copy has been extracted
+        reused = None if force else (await db.execute(
+            _SELECT_EXTRACTION_BY_FILE_HASH, {"file_hash": policy.file_hash, "policy_pk": policy.id}
+        )).first()
+        
+        if reused is not None:
+            # Nothing slow left to do, so the record goes straight to
+            # completed in a single commit
+            logger.info(f"Reusing text extracted from an identical file for policy: {policy_id}")
+            extracted_text = reused.extracted_text
+            result_data = {**reused.result_data, "extraction_timestamp": datetime.utcnow().isoformat()}
+        else:
+            # Publish the in-progress record before parsing rather than
+            # holding a write transaction open for the whole extraction
+            await db.commit()
+            
+            # Extract text from PDF; parsing is CPU and disk bound, so keep it
+            # off the event loop
+            extraction = await asyncio.to_thread(extract_pdf, file_path)
+            extracted_text = extraction.text
+            
+            # Store result
+            result_data = {
+                "character_count": len(extracted_text),
+                "word_count": len(extracted_text.split()),
+                "extraction_timestamp": datetime.utcnow().isoformat()
+            }
+            if extraction.image_only_pages:
+                # Pages with no text layer, for a later OCR pass
+                result_data["skipped_pages"] = [
+                    {"page": page, "skipped": "image_only"} for page in extraction.image_only_pages
+                ]
         
         # Update processing record
         processing_record.status = ProcessingStatus.COMPLETED
         processing_record.progress_percent = 100
         processing_record.completed_at = datetime.utcnow()
         processing_record.result_data = result_data
+        processing_record.extracted_text = extracted_text
         
         await db.commit()
-        await db.refresh(processing_record)
         
         logger.info(f"Text extraction completed for policy: {policy_id}")
         
@@ -215,10 +586,15 @@ async def process_policy_text_extraction(
         }
         
     except Exception as e:
-        # Update processing record with error
+        # A failed statement (e.g. the hash write-back losing a race on the
+        # live-hash index) leaves the transaction unusable; roll it back and
+        # record the failure in a fresh one. A record never committed is
+        # expunged by the rollback, so add it again.
+        await db.rollback()
         processing_record.status = ProcessingStatus.FAILED
         processing_record.error_message = str(e)
         processing_record.completed_at = datetime.utcnow()
+        db.add(processing_record)
         
         await db.commit()
         
@@ -230,6 +606,32 @@ async def process_policy_text_extraction(
         )
 
 
+async def get_extracted_text_record(
+    policy_id: str,
+    db: AsyncSession,
+    include_text: bool = True
+) -> Optional[Row]:
+    """
+    Retrieve a policy's filename and extraction result in a single query.
+    
+    The character and word counts stored at extraction time are returned
+    as-is, so serving them needs no string processing. With
+    include_text=False the text itself is never sent by the database.
+    
+    Args:
+        policy_id: Unique policy identifier
+        db: Database session
+        include_text: Whether to fetch the extracted text
+        
+    Returns:
+        Row with filename, character_count, word_count and (if requested)
+        extracted_text; the result fields are None if nothing was extracted.
+        None if the policy does not exist.
+    """
+    stmt = _SELECT_LIVE_POLICY_TEXT if include_text else _SELECT_LIVE_POLICY_TEXT_STATS
+    return (await db.execute(stmt, {"policy_id": policy_id})).first()
+
+
 async def get_extracted_text(policy_id: str, db: AsyncSession) -> Optional[str]:
     """
     Retrieve extracted text for a policy.
@@ -243,30 +645,12 @@ async def get_extracted_text(policy_id: str, db: AsyncSession) -> Optional[str]:
     """
     logger.info(f"Retrieving extracted text for policy: {policy_id}")
     
-    # Get policy
-    stmt = select(Policy).where(
-        Policy.policy_id == policy_id,
-        Policy.deleted_at.is_(None)
-    )
-    result = await db.execute(stmt)
-    policy = result.scalar_one_or_none()
+    record = await get_extracted_text_record(policy_id, db)
     
-    if not policy:
+    if record is None:
         raise TextExtractionError(
             message=f"Policy not found: {policy_id}",
             details={"policy_id": policy_id}
         )
     
-    # Get processing record
-    proc_stmt = select(PolicyProcessing).where(
-        PolicyProcessing.policy_id == policy.id,
-        PolicyProcessing.stage == ProcessingStage.TEXT_EXTRACTION,
-        PolicyProcessing.status == ProcessingStatus.COMPLETED
-    )
-    proc_result = await db.execute(proc_stmt)
-    processing_record = proc_result.scalar_one_or_none()
-    
-    if not processing_record or not processing_record.result_data:
-        return None
-    
-    return processing_record.result_data.get("extracted_text")
+    return record.extracted_text
@@ -3,11 +3,17 @@ File-related utility functions.
 Provides helpers for file validation, hashing, and manipulation.
 """
 
+import asyncio
 import hashlib
+import mmap
+import os
 import secrets
 import string
+import threading
+from functools import partial
+from itertools import product
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Callable, Optional, Tuple
 from fastapi import UploadFile, HTTPException, status
 
 from app.constants import (
@@ -16,6 +22,7 @@ from app.constants import (
     ALLOWED_CONTENT_TYPES,
     HASH_ALGORITHM,
     HASH_BUFFER_SIZE,
+    UPLOAD_CHUNK_SIZE,
     POLICY_ID_PREFIX,
     POLICY_ID_LENGTH,
     ERROR_FILE_TOO_LARGE,
@@ -23,6 +30,47 @@ from app.constants import (
 )
 
 
+def _resolve_hash_constructor(algorithm: str) -> Callable[..., "hashlib._Hash"]:
+    """
+    Resolve the fastest available constructor for a hash algorithm.
+
+    The named constructors (``hashlib.sha256`` etc.) are bound straight to
+    OpenSSL's EVP implementation, which dispatches to SHA-NI / ARMv8 crypto
+    instructions when the CPU supports them. ``hashlib.new`` goes through a
+    slower name lookup on every call, so it is only used as a fallback for
+    algorithms without a dedicated constructor.
+
+    Args:
+        algorithm: Hash algorithm name (e.g. "sha256")
+
+    Returns:
+        Callable returning a fresh hash object
+    """
+    constructor = getattr(hashlib, algorithm, None)
+    if callable(constructor):
+        return constructor
+    return lambda data=b"": hashlib.new(algorithm, data)
+
+
+# Resolved once at import time so the upload hot path skips the lookup
+_DEFAULT_HASH = _resolve_hash_constructor(HASH_ALGORITHM)
+
+# Every capitalisation of the allowed extensions, so validate_pdf matches
+# with one endswith() call instead of splitting and lowercasing the name
+_ALLOWED_SUFFIXES = tuple(
+    "".join(chars)
+    for extension in ALLOWED_FILE_EXTENSIONS
+    for chars in product(*({char.lower(), char.upper()} for char in extension))
+)
+
+# ASCII codepoints sanitize_filename replaces with "_"; anything beyond
+# ASCII is first turned into "?" by the ascii codec, so it is caught too
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+_FILENAME_TRANSLATION = {
+    code: "_" for code in range(128) if chr(code) not in _SAFE_FILENAME_CHARS
+}
+
+
 def validate_file_type(file: UploadFile, allowed_extensions: set = ALLOWED_FILE_EXTENSIONS) -> None:
     """
     Validate that the uploaded file has an allowed extension and content type.
@@ -64,7 +112,7 @@ def validate_file_size(file_size: int, max_size: int = MAX_FILE_SIZE_BYTES) -> N
     if file_size > max_size:
         max_size_mb = max_size / (1024 * 1024)
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=ERROR_FILE_TOO_LARGE.format(max_size=max_size_mb)
         )
 
@@ -79,14 +127,23 @@ def validate_pdf(file: UploadFile) -> None:
     Raises:
         HTTPException: If file validation fails
     """
-    validate_file_type(file)
-    # Note: File size validation happens after reading content
+    filename = file.filename or ""
+    if not (filename.endswith(_ALLOWED_SUFFIXES) and file.content_type in ALLOWED_CONTENT_TYPES):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_INVALID_FILE_TYPE
+        )
+    # Note: File size validation happens while streaming the content
 
 
 def calculate_file_hash(content: bytes, algorithm: str = HASH_ALGORITHM) -> str:
     """
     Calculate hash of file content.
     
+    Only for content that is already in memory; files and uploads are
+    hashed by streaming them (calculate_file_hash_chunked, hash_upload)
+    so they are never read into memory in full.
+    
     Args:
         content: File content as bytes
         algorithm: Hash algorithm to use (default: sha256)
@@ -94,9 +151,9 @@ def calculate_file_hash(content: bytes, algorithm: str = HASH_ALGORITHM) -> str:
     Returns:
         Hexadecimal hash string
     """
-    hash_obj = hashlib.new(algorithm)
-    hash_obj.update(content)
-    return hash_obj.hexdigest()
+    if algorithm == HASH_ALGORITHM:
+        return _DEFAULT_HASH(content).hexdigest()
+    return _resolve_hash_constructor(algorithm)(content).hexdigest()
 
 
 def calculate_file_hash_chunked(file_path: Path, algorithm: str = HASH_ALGORITHM) -> str:
@@ -110,15 +167,221 @@ def calculate_file_hash_chunked(file_path: Path, algorithm: str = HASH_ALGORITHM
     Returns:
         Hexadecimal hash string
     """
-    hash_obj = hashlib.new(algorithm)
+    if algorithm == HASH_ALGORITHM:
+        hash_obj = _DEFAULT_HASH()
+    else:
+        hash_obj = _resolve_hash_constructor(algorithm)()
     
     with open(file_path, 'rb') as f:
-        while chunk := f.read(HASH_BUFFER_SIZE):
-            hash_obj.update(chunk)
+        # Hash the mapped file in a single update: no Python read loop, and
+        # OpenSSL reads straight from the page cache (mmap rejects empty files)
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
     
     return hash_obj.hexdigest()
 
 
+# Per-thread chunk buffers, reused across uploads instead of allocating a
+# fresh bytes object for every chunk read
+_chunk_buffers = threading.local()
+
+
+def _chunk_buffer(chunk_size: int) -> mmap.mmap:
+    """Return this thread's page-aligned chunk buffer, sized to chunk_size."""
+    buffer = getattr(_chunk_buffers, "buffer", None)
+    if buffer is None or len(buffer) != chunk_size:
+        buffer = _chunk_buffers.buffer = mmap.mmap(-1, chunk_size)
+    return buffer
+
+
+def _read_into(source: BinaryIO, buffer: mmap.mmap) -> int:
+    """readinto() fallback for file objects that lack it (Python < 3.11 spooled files)."""
+    chunk = source.read(len(buffer))
+    buffer[:len(chunk)] = chunk
+    return len(chunk)
+
+
+def _digest_stream(source: BinaryIO, hash_obj: "hashlib._Hash") -> str:
+    """
+    Feed a file object into hash_obj from its current position to EOF.
+    
+    Like hashlib.file_digest, but with a HASH_BUFFER_SIZE buffer that is
+    reused across calls, so each OpenSSL update covers a large chunk and
+    no bytes object is allocated per read.
+    """
+    buffer = _chunk_buffer(HASH_BUFFER_SIZE)
+    readinto = getattr(source, "readinto", None) or partial(_read_into, source)
+    with memoryview(buffer) as view:
+        while read := readinto(buffer):
+            hash_obj.update(view[:read])
+    return hash_obj.hexdigest()
+
+
+def _disk_fileno(source: BinaryIO) -> Optional[int]:
+    """
+    File descriptor of an upload spool that lives on disk, else None.
+    
+    Starlette spools request bodies into a SpooledTemporaryFile that moves
+    to disk past 1MB. Asking an in-memory spool for fileno() would force
+    that move, so it is checked first, the same way Starlette does.
+    """
+    if not getattr(source, "_rolled", True):
+        return None
+    try:
+        return source.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _copy_file_range(source_fd: int, destination: Path, max_size: int) -> Optional[int]:
+    """
+    Copy a whole file to destination inside the kernel, with no userspace buffer.
+    
+    Returns:
+        Number of bytes written, or None if the kernel or filesystem cannot
+        do the copy (destination is left empty then)
+    """
+    file_size = os.fstat(source_fd).st_size
+    validate_file_size(file_size, max_size)
+    
+    with open(destination, "wb") as out:
+        offset = 0
+        try:
+            while offset < file_size:
+                copied = os.copy_file_range(
+                    source_fd, out.fileno(), file_size - offset, offset, offset
+                )
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            # e.g. ENOSYS or EXDEV on older kernels; the caller copies in userspace
+            out.truncate(0)
+            return None
+    return offset
+
+
+def _copy_upload(
+    source: BinaryIO,
+    destination: Path,
+    max_size: int,
+    chunk_size: int
+) -> int:
+    """Blocking copy loop behind save_upload_file; runs in a worker thread."""
+    source_fd = _disk_fileno(source) if hasattr(os, "copy_file_range") else None
+    if source_fd is not None:
+        copied = _copy_file_range(source_fd, destination, max_size)
+        if copied is not None:
+            return copied
+
+    file_size = 0
+    buffer = _chunk_buffer(chunk_size)
+    readinto = getattr(source, "readinto", None) or partial(_read_into, source)
+    
+    with memoryview(buffer) as view, open(destination, "wb") as out:
+        while read := readinto(buffer):
+            file_size += read
+            validate_file_size(file_size, max_size)
+            out.write(view[:read])
+    
+    return file_size
+
+
+def _measure_and_hash(source: BinaryIO, max_size: int) -> Tuple[int, str]:
+    """Blocking size check and SHA-256 behind fingerprint_upload."""
+    file_size = source.seek(0, os.SEEK_END)
+    validate_file_size(file_size, max_size)
+    source.seek(0)
+    digest = _digest_stream(source, _DEFAULT_HASH())
+    source.seek(0)
+    return file_size, digest
+
+
+async def fingerprint_upload(
+    file: UploadFile,
+    max_size: int = MAX_FILE_SIZE_BYTES
+) -> Tuple[int, str]:
+    """
+    Size-check and hash an upload before it is stored.
+    
+    Starlette has already spooled the request body by the time an endpoint
+    runs, so the size and SHA-256 are read from that spool in one worker
+    thread job. This lets oversized uploads and duplicates be rejected
+    without writing anything to the upload directory.
+    
+    Args:
+        file: The uploaded file to inspect
+        max_size: Maximum allowed size in bytes
+        
+    Returns:
+        Tuple of (file size in bytes, hexadecimal SHA-256 hash)
+        
+    Raises:
+        HTTPException: If file size exceeds maximum
+    """
+    # The multipart parser usually knows the size already
+    if file.size is not None:
+        validate_file_size(file.size, max_size)
+    
+    return await asyncio.to_thread(_measure_and_hash, file.file, max_size)
+
+
+async def save_upload_file(
+    file: UploadFile,
+    destination: Path,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> int:
+    """
+    Stream an uploaded file to disk.
+    
+    The upload is never buffered in full: each chunk is written out before
+    the next one is read. Uploads whose declared size is over the limit are
+    rejected up front, and the copy is still aborted as soon as the running
+    size exceeds it.
+    
+    The whole copy is submitted to a worker thread as a single job, so the
+    event loop is never blocked and pays one thread hand-off per upload
+    instead of one per chunk read and write. When the spool has already
+    gone to disk, the kernel copies it with copy_file_range and the bytes
+    never pass through Python.
+
+    Args:
+        file: The uploaded file to persist
+        destination: Path to write the file to
+        max_size: Maximum allowed size in bytes
+        chunk_size: Number of bytes to read per iteration
+        
+    Returns:
+        Number of bytes written
+        
+    Raises:
+        HTTPException: If file size exceeds maximum
+    """
+    # The multipart parser already knows the size; reject before any disk I/O
+    if file.size is not None:
+        validate_file_size(file.size, max_size)
+    
+    await file.seek(0)
+    return await asyncio.to_thread(
+        _copy_upload, file.file, destination, max_size, chunk_size
+    )
+
+
+async def remove_file(path: Path) -> None:
+    """
+    Delete a file if it exists, without blocking the event loop.
+    
+    Args:
+        path: Path of the file to remove
+    """
+    await asyncio.to_thread(path.unlink, missing_ok=True)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in bytes to human-readable string.
@@ -129,18 +392,15 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
-    size = float(size_bytes)
-    
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
-    
-    return f"{size:.2f} {units[unit_index]}"
+    # Each unit is 2**10 of the previous, so the bit length picks it directly
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit_index * 10)):.2f} {_SIZE_UNITS[unit_index]}"
+
+
+_ID_ALPHABET = string.ascii_lowercase + string.digits
 
 
 def generate_unique_id(prefix: str = POLICY_ID_PREFIX, length: int = POLICY_ID_LENGTH) -> str:
@@ -154,9 +414,14 @@ def generate_unique_id(prefix: str = POLICY_ID_PREFIX, length: int = POLICY_ID_L
     Returns:
         Unique identifier string (e.g., "pol_abc123xyz789")
     """
-    alphabet = string.ascii_lowercase + string.digits
-    random_part = ''.join(secrets.choice(alphabet) for _ in range(length))
-    return f"{prefix}{random_part}"
+    # One draw of the whole ID space, written out in base 36, instead of
+    # a separate secrets.choice (and urandom read) per character
+    value = secrets.randbelow(len(_ID_ALPHABET) ** length)
+    random_part = []
+    for _ in range(length):
+        value, digit = divmod(value, len(_ID_ALPHABET))
+        random_part.append(_ID_ALPHABET[digit])
+    return f"{prefix}{''.join(random_part)}"
 
 
 def get_file_extension(filename: str) -> str:
@@ -187,13 +452,10 @@ def sanitize_filename(filename: str) -> str:
     # Get the base name without extension
     base = Path(filename).stem
     
-    # Replace spaces and special characters with underscores
-    safe_chars = string.ascii_letters + string.digits + "-_"
-    sanitized_base = ''.join(c if c in safe_chars else '_' for c in base)
+    # Replace spaces and special characters with underscores, one per character
+    sanitized_base = base.encode("ascii", "replace").decode("ascii").translate(_FILENAME_TRANSLATION)
     
     # Limit length
-    max_length = 200
-    if len(sanitized_base) > max_length:
-        sanitized_base = sanitized_base[:max_length]
+    sanitized_base = sanitized_base[:200]
     
     return f"{sanitized_base}{ext}"
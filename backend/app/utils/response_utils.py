@@ -3,8 +3,15 @@ Response utility functions.
 Provides helpers for building standardized API responses.
 """
 
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+from typing import Any, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
+import base64
+import time
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, to the second."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(timespec="seconds")
 
 
 def success_response(
@@ -26,7 +33,7 @@ def success_response(
     response = {
         "success": True,
         "message": message,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
     
     if data is not None:
@@ -57,7 +64,7 @@ def error_response(
     response = {
         "success": False,
         "message": message,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
     
     if error_code:
@@ -99,8 +106,44 @@ def paginated_response(
             "count": len(items),
             "has_more": (offset + len(items)) < total
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
     
     response.update(kwargs)
     return response
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a keyset pagination cursor.
+    
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        row_id: Primary key of the last row on the page
+        
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a keyset pagination cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        Tuple of (created_at, row_id)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
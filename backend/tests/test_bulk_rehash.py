@@ -0,0 +1,106 @@
+"""
+Tests for the bulk re-hashing service.
+"""
+
+import hashlib
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models.policy import Policy, PolicyStatus
+from app.services.bulk_rehash import hash_files, rehash_all
+
+
+class TestHashFiles:
+    """Test concurrent file hashing."""
+
+    @pytest.mark.asyncio
+    async def test_digests_in_input_order(self, tmp_path):
+        """Test that digests line up with the input paths."""
+        contents = [bytes([i]) * (100_000 + i) for i in range(6)]
+        paths = []
+        for i, content in enumerate(contents):
+            path = tmp_path / f"policy_{i}.pdf"
+            path.write_bytes(content)
+            paths.append(path)
+
+        digests = await hash_files(paths, max_workers=3)
+
+        assert digests == [hashlib.sha256(content).hexdigest() for content in contents]
+
+    @pytest.mark.asyncio
+    async def test_missing_file_yields_none(self, tmp_path):
+        """Test that a missing file does not abort the batch."""
+        present = tmp_path / "present.pdf"
+        present.write_bytes(b"%PDF-1.4")
+
+        digests = await hash_files([tmp_path / "gone.pdf", present])
+
+        assert digests[0] is None
+        assert digests[1] == hashlib.sha256(b"%PDF-1.4").hexdigest()
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database holding just the policies table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Policy.metadata.create_all, tables=[Policy.__table__])
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _add_policy(db, policy_id, file_path, file_hash):
+    """Store a live policy row pointing at file_path."""
+    await db.execute(insert(Policy.__table__).values(
+        policy_id=policy_id,
+        filename=f"{policy_id}.pdf",
+        file_path=str(file_path),
+        file_size=1024,
+        file_hash=file_hash,
+        content_type="application/pdf",
+        status=PolicyStatus.UPLOADED,
+    ))
+    await db.commit()
+
+
+async def _stored_hashes(db):
+    """Map each policy_id to its stored file_hash."""
+    policies = Policy.__table__.c
+    return dict((await db.execute(select(policies.policy_id, policies.file_hash))).all())
+
+
+class TestRehashAll:
+    """Test the stored-hash verification."""
+
+    @pytest.mark.asyncio
+    async def test_matching_hashes_pass(self, db, tmp_path):
+        """Test that unchanged files are hashed in batches and reported clean."""
+        for n in range(3):
+            content = b"%PDF-1.4 policy " + bytes([n])
+            path = tmp_path / f"policy_{n}.pdf"
+            path.write_bytes(content)
+            await _add_policy(db, f"pol_{n}", path, file_hash=hashlib.sha256(content).hexdigest())
+
+        stats = await rehash_all(db, batch_size=2)
+
+        assert stats == {"hashed": 3, "mismatched": 0, "missing": 0}
+
+    @pytest.mark.asyncio
+    async def test_reports_mismatch_and_missing_files(self, db, tmp_path):
+        """Test that bad hashes and missing files are reported without changing them."""
+        path = tmp_path / "changed.pdf"
+        path.write_bytes(b"%PDF-1.4 edited on disk")
+        stale = hashlib.sha256(b"%PDF-1.4 as uploaded").hexdigest()
+        gone = hashlib.sha256(b"%PDF-1.4 deleted").hexdigest()
+        await _add_policy(db, "pol_changed", path, file_hash=stale)
+        await _add_policy(db, "pol_gone", tmp_path / "gone.pdf", file_hash=gone)
+
+        stats = await rehash_all(db)
+
+        assert stats == {"hashed": 2, "mismatched": 1, "missing": 1}
+        assert await _stored_hashes(db) == {"pol_changed": stale, "pol_gone": gone}
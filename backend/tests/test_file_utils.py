@@ -0,0 +1,220 @@
+"""
+Tests for file utility helpers.
+"""
+
+import hashlib
+import io
+import tempfile
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from app.utils.file_utils import (
+    calculate_file_hash,
+    calculate_file_hash_chunked,
+    remove_file,
+    sanitize_filename,
+    fingerprint_upload,
+    format_file_size,
+    generate_unique_id,
+    save_upload_file,
+    validate_pdf,
+)
+
+
+class TestFileHashing:
+    """Test file hashing helpers."""
+
+    def test_default_hash_matches_sha256(self):
+        """Test that the default algorithm produces a SHA-256 digest."""
+        content = b"%PDF-1.4 sample policy content"
+        assert calculate_file_hash(content) == hashlib.sha256(content).hexdigest()
+
+    def test_explicit_algorithm(self):
+        """Test that a non-default algorithm is honoured."""
+        content = b"policy"
+        assert calculate_file_hash(content, "md5") == hashlib.md5(content).hexdigest()
+
+    def test_chunked_matches_in_memory(self, tmp_path):
+        """Test that chunked hashing of a file matches hashing its bytes."""
+        content = b"x" * 200_000
+        file_path = tmp_path / "policy.pdf"
+        file_path.write_bytes(content)
+        assert calculate_file_hash_chunked(file_path) == calculate_file_hash(content)
+
+    def test_chunked_empty_file(self, tmp_path):
+        """Test that an empty file hashes to the digest of no bytes."""
+        file_path = tmp_path / "empty.pdf"
+        file_path.write_bytes(b"")
+        assert calculate_file_hash_chunked(file_path) == hashlib.sha256(b"").hexdigest()
+
+    def test_chunked_spans_several_buffers(self, tmp_path):
+        """Test that files larger than the hash buffer are hashed in full."""
+        content = bytes(range(256)) * 10_000  # ~2.4MB, not a buffer multiple
+        file_path = tmp_path / "policy.pdf"
+        file_path.write_bytes(content)
+        assert calculate_file_hash_chunked(file_path) == hashlib.sha256(content).hexdigest()
+
+
+def _upload(filename, content_type):
+    """Build an empty upload with the given name and content type."""
+    return UploadFile(
+        file=io.BytesIO(b""),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+class TestValidatePdf:
+    """Test PDF upload validation."""
+
+    @pytest.mark.parametrize("filename", ["policy.pdf", "POLICY.PDF", "Policy.Pdf", "scan.pDf"])
+    def test_accepts_any_extension_case(self, filename):
+        """Test that the extension check is case-insensitive."""
+        validate_pdf(_upload(filename, "application/pdf"))
+
+    @pytest.mark.parametrize(
+        "filename,content_type",
+        [
+            ("policy.txt", "application/pdf"),
+            ("policy.pdf.exe", "application/pdf"),
+            ("policy.pdf", "text/plain"),
+            (None, "application/pdf"),
+        ],
+    )
+    def test_rejects_other_files(self, filename, content_type):
+        """Test that a wrong extension or content type is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_pdf(_upload(filename, content_type))
+
+        assert exc_info.value.status_code == 400
+
+
+class TestSaveUploadFile:
+    """Test streaming upload persistence."""
+
+    @pytest.mark.asyncio
+    async def test_streams_content(self, tmp_path):
+        """Test that the stored file matches the upload."""
+        content = b"%PDF-1.4 " + b"a" * 100_000
+        upload = UploadFile(file=io.BytesIO(content), filename="policy.pdf")
+        destination = tmp_path / "stored.pdf"
+
+        file_size = await save_upload_file(upload, destination, chunk_size=4096)
+
+        assert file_size == len(content)
+        assert destination.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_copies_disk_spool(self, tmp_path):
+        """Test that a spool already rolled to disk is stored intact."""
+        content = b"%PDF-1.4 " + b"c" * 3_000_000
+        spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        spool.write(content)
+        upload = UploadFile(file=spool, filename="policy.pdf")
+        destination = tmp_path / "stored.pdf"
+
+        file_size = await save_upload_file(upload, destination)
+
+        assert file_size == len(content)
+        assert destination.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_fingerprints_spooled_upload(self):
+        """Test that size and hash come from the spool, rewound."""
+        content = b"%PDF-1.4 " + b"a" * 100_000
+        upload = UploadFile(file=io.BytesIO(content), filename="policy.pdf")
+
+        file_size, file_hash = await fingerprint_upload(upload)
+
+        assert file_size == len(content)
+        assert file_hash == hashlib.sha256(content).hexdigest()
+        assert upload.file.tell() == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload(self, tmp_path):
+        """Test that streaming aborts once the size limit is exceeded."""
+        upload = UploadFile(file=io.BytesIO(b"b" * 10_000), filename="policy.pdf")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await save_upload_file(upload, tmp_path / "big.pdf", max_size=1000, chunk_size=512)
+
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_rejects_declared_oversize_before_writing(self, tmp_path):
+        """Test that a known oversized upload is rejected without touching disk."""
+        upload = UploadFile(file=io.BytesIO(b"b" * 10_000), filename="policy.pdf", size=10_000)
+        destination = tmp_path / "big.pdf"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await save_upload_file(upload, destination, max_size=1000)
+
+        assert exc_info.value.status_code == 413
+        assert not destination.exists()
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_rejects_oversized_upload(self):
+        """Test that an oversized upload is rejected from its spool."""
+        upload = UploadFile(file=io.BytesIO(b"b" * 10_000), filename="policy.pdf")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await fingerprint_upload(upload, max_size=1000)
+
+        assert exc_info.value.status_code == 413
+
+
+class TestRemoveFile:
+    """Test off-loop file cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_removes_existing_file(self, tmp_path):
+        """Test that an existing file is deleted."""
+        path = tmp_path / "stored.pdf"
+        path.write_bytes(b"%PDF-1.4")
+
+        await remove_file(path)
+
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_ignored(self, tmp_path):
+        """Test that removing a missing file does not raise."""
+        await remove_file(tmp_path / "never-written.pdf")
+
+
+class TestSanitizeFilename:
+    """Test filename sanitization."""
+
+    def test_replaces_each_unsafe_character(self):
+        """Test that every unsafe character, non-ASCII included, becomes one underscore."""
+        assert sanitize_filename("Health Policy (v2).PDF") == "Health_Policy__v2_.pdf"
+        assert sanitize_filename("नीति-2024_é.pdf") == "____-2024__.pdf"
+
+    def test_truncates_long_names(self):
+        """Test that the base name is capped at 200 characters."""
+        assert sanitize_filename("a" * 300 + ".pdf") == "a" * 200 + ".pdf"
+
+
+class TestFormatFileSize:
+    """Test human-readable file sizes."""
+
+    def test_unit_boundaries(self):
+        """Test that each unit starts at the next power of 1024."""
+        assert format_file_size(0) == "0 B"
+        assert format_file_size(1023) == "1023.00 B"
+        assert format_file_size(1024) == "1.00 KB"
+        assert format_file_size(1536 * 1024) == "1.50 MB"
+        assert format_file_size(1024 ** 5) == "1024.00 TB"
+
+
+class TestGenerateUniqueId:
+    """Test policy identifier generation."""
+
+    def test_format(self):
+        """Test that IDs are the prefix plus lowercase alphanumerics of the requested length."""
+        policy_id = generate_unique_id("pol_", 12)
+        assert policy_id.startswith("pol_")
+        assert len(policy_id) == 16
+        assert policy_id[4:].isalnum() and policy_id[4:] == policy_id[4:].lower()
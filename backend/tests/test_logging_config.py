@@ -0,0 +1,66 @@
+"""
+Tests for the buffered log file handler.
+"""
+
+import logging
+
+from app.core.logging_config import _BufferedRotatingFileHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestBufferedRotatingFileHandler:
+    """Test buffering and size-based rollover."""
+
+    def test_records_stay_buffered_until_flush(self, tmp_path):
+        """Test that emitting records does not write them to disk."""
+        log_file = tmp_path / "app.log"
+        handler = _BufferedRotatingFileHandler(log_file, maxBytes=1024 * 1024, encoding="utf-8")
+        try:
+            for i in range(5):
+                handler.emit(_record(f"line {i}"))
+                assert log_file.stat().st_size == 0
+
+            handler.flush()
+
+            assert log_file.read_text(encoding="utf-8").splitlines() == [
+                f"line {i}" for i in range(5)
+            ]
+        finally:
+            handler.close()
+
+    def test_rollover_counts_encoded_bytes(self, tmp_path):
+        """Test that the size limit applies to bytes, not characters."""
+        log_file = tmp_path / "app.log"
+        # Each record is 9 characters but 17 bytes in UTF-8
+        message = "é" * 8
+        handler = _BufferedRotatingFileHandler(
+            log_file, maxBytes=30, backupCount=3, encoding="utf-8"
+        )
+        try:
+            for _ in range(3):
+                handler.emit(_record(message))
+            handler.flush()
+        finally:
+            handler.close()
+
+        for path in (log_file, tmp_path / "app.log.1", tmp_path / "app.log.2"):
+            assert path.read_text(encoding="utf-8") == message + "\n"
+
+    def test_size_of_existing_file_is_counted(self, tmp_path):
+        """Test that a reopened file rolls over based on what it already holds."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("x" * 20 + "\n", encoding="utf-8")
+        handler = _BufferedRotatingFileHandler(
+            log_file, maxBytes=30, backupCount=1, encoding="utf-8"
+        )
+        try:
+            handler.emit(_record("y" * 10))
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == "x" * 20 + "\n"
+        assert log_file.read_text(encoding="utf-8") == "y" * 10 + "\n"
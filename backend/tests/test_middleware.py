@@ -0,0 +1,60 @@
+"""
+Tests for custom ASGI middleware.
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from httpx import AsyncClient
+
+from app.core.middleware import JSONGZipMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return ORJSONResponse({"items": ["policy"] * 500})
+
+    @app.get("/small")
+    async def small():
+        return ORJSONResponse({"ok": True})
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for _ in range(200):
+                yield b'{"token": "text"}\n'
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Create test client."""
+    async with AsyncClient(app=_build_app(), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_compressed(client):
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"items": ["policy"] * 500}
+
+
+@pytest.mark.asyncio
+async def test_small_json_is_not_compressed(client):
+    response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streamed_ndjson_passes_through(client):
+    response = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.content == b'{"token": "text"}\n' * 200
@@ -0,0 +1,70 @@
+"""
+Tests for building policy response models from database rows.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+
+from app.api.v1.endpoints.policies import _encode_policy_list
+from app.models.policy import PolicyStatus, PolicyType
+from app.schemas.policy import PolicyListResponse, PolicyPublic, from_orm_fast
+
+
+def _policy_row(**overrides):
+    """Stand-in for a Policy row carrying every public column."""
+    row = dict(
+        id=7,
+        policy_id="pol_abc123def456",
+        title="Student Loan Forgiveness",
+        description="Federal forgiveness programme",
+        language="en",
+        jurisdiction="Federal",
+        policy_type=PolicyType.EDUCATION,
+        effective_date=datetime(2024, 1, 1),
+        expiry_date=None,
+        source_url="https://example.gov/policy.pdf",
+        filename="policy.pdf",
+        file_size=4169,
+        content_type="application/pdf",
+        version=2,
+        status=PolicyStatus.UPLOADED,
+        created_at=datetime(2024, 5, 1, 12, 30),
+        updated_at=datetime(2024, 5, 2, 8, 0),
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestFromOrmFast:
+    """Guard the unvalidated list serialization against schema drift."""
+
+    def test_matches_validated_model(self):
+        """Test that model_construct output serializes like model_validate."""
+        row = _policy_row()
+        assert (
+            from_orm_fast(PolicyPublic, row).model_dump(mode="json")
+            == PolicyPublic.model_validate(row).model_dump(mode="json")
+        )
+
+    def test_matches_with_optional_fields_unset(self):
+        """Test equality when nullable metadata columns are empty."""
+        row = _policy_row(title=None, description=None, jurisdiction=None, policy_type=None, source_url=None)
+        assert (
+            from_orm_fast(PolicyPublic, row).model_dump(mode="json")
+            == PolicyPublic.model_validate(row).model_dump(mode="json")
+        )
+
+
+class TestEncodePolicyList:
+    """Guard the hand-encoded list page against PolicyListResponse drift."""
+
+    def test_matches_response_model(self):
+        """Test that the orjson body equals the response model's JSON dump."""
+        rows = [_policy_row(), _policy_row(id=8, policy_type=None, updated_at=datetime(2024, 5, 3, tzinfo=timezone.utc))]
+        expected = PolicyListResponse(
+            policies=[PolicyPublic.model_validate(row) for row in rows],
+            total=2, limit=20, offset=0, next_cursor="abc"
+        ).model_dump(mode="json")
+        assert orjson.loads(_encode_policy_list(rows, 2, 20, 0, "abc")) == expected
@@ -0,0 +1,39 @@
+"""
+Tests for response utility helpers.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.response_utils import encode_cursor, decode_cursor, paginated_response
+
+
+class TestPaginationCursor:
+    """Test keyset pagination cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the values it was built from."""
+        created_at = datetime(2024, 1, 27, 18, 0, 0, 123456)
+        cursor = encode_cursor(created_at, 42)
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Test that the cursor can be passed as a query parameter unescaped."""
+        cursor = encode_cursor(datetime(2024, 1, 27), 7)
+        assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+    def test_malformed_cursor_raises(self):
+        """Test that garbage input raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestResponseTimestamp:
+    """Test the timestamp stamped on response envelopes."""
+
+    def test_timestamp_is_utc_iso_to_the_second(self):
+        """Test that the timestamp parses as an aware UTC time without microseconds."""
+        stamped = datetime.fromisoformat(paginated_response([], 0, 20, 0)["timestamp"])
+        assert stamped.tzinfo == timezone.utc
+        assert stamped.microsecond == 0
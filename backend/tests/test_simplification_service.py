@@ -11,7 +11,7 @@ from app.services.simplification_service import (
     simplify_policy,
     SimplificationError
 )
-from app.models.policy import Policy, PolicyStatus, PolicyChunk, PolicyProcessing, ProcessingStage, ProcessingStatus
+from app.models.policy import Policy, PolicyStatus, PolicyChunk, ProcessingStage, ProcessingStatus
 from app.services.llm_service import LLMError
 
 
@@ -79,13 +79,10 @@ async def test_get_policy_text_from_processing_record(mock_db, sample_policy):
     chunks_result = MagicMock()
     chunks_result.scalars.return_value.all.return_value = []  # No chunks
     
-    processing = MagicMock(spec=PolicyProcessing)
-    processing.result_data = {
-        "extracted_text": "This is the full extracted text from the policy document."
-    }
-    
     processing_result = MagicMock()
-    processing_result.scalar_one_or_none.return_value = processing
+    processing_result.scalar_one_or_none.return_value = (
+        "This is the full extracted text from the policy document."
+    )
     
     mock_db.execute.side_effect = [policy_result, chunks_result, processing_result]
     
@@ -5,11 +5,24 @@ Tests the text extraction service with a minimal PDF.
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.services.text_extraction import extract_text_from_pdf
+from app.models.policy import ProcessingStatus
+from app.services import text_extraction
+from app.services.text_extraction import (
+    TextExtractionError,
+    extract_pdf,
+    extract_text_from_pdf,
+    process_policy_text_extraction,
+    shutdown_page_pool,
+)
 
 
 def create_minimal_pdf(output_path: Path) -> bool:
@@ -109,6 +122,124 @@ def test_text_extraction():
             pass
 
 
+def build_pdf(page_contents) -> bytes:
+    """Build a PDF whose pages draw the given content streams.
+    
+    Every page has a Helvetica font and a 1x1 image XObject (/Im1) available.
+    """
+    page_count = len(page_contents)
+    font_id, image_id = 3 + 2 * page_count, 4 + 2 * page_count
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(page_count))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+    ]
+    for i, content in enumerate(page_contents):
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> /XObject << /Im1 {image_id} 0 R >> >> >>"
+        ).encode())
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    objects.append(
+        b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+        b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"
+    )
+    
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF" % (len(objects) + 1, xref_offset)
+    return bytes(pdf)
+
+
+def test_image_only_pages_are_skipped(tmp_path):
+    """Scanned pages are reported for OCR instead of being extracted."""
+    pdf_path = tmp_path / "scanned.pdf"
+    pdf_path.write_bytes(build_pdf([
+        b"BT /F1 12 Tf 50 750 Td (Eligibility rules) Tj ET",
+        b"q 100 0 0 100 0 0 cm /Im1 Do Q",
+        b"q 100 0 0 100 0 0 cm /Im1 Do Q BT /F1 12 Tf 50 750 Td (Signed notice) Tj ET",
+    ]))
+    
+    extraction = extract_pdf(pdf_path)
+    
+    assert extraction.total_pages == 3
+    assert extraction.image_only_pages == [2]
+    assert "Eligibility rules" in extraction.text
+    assert "Signed notice" in extraction.text
+
+
+def test_long_documents_are_extracted_in_page_order(tmp_path, monkeypatch):
+    """Page ranges extracted by the worker pool are merged back in order."""
+    monkeypatch.setattr(text_extraction, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(text_extraction, "PDF_PAGES_PER_TASK", 2)
+    pdf_path = tmp_path / "long.pdf"
+    pdf_path.write_bytes(build_pdf(
+        [b"BT /F1 12 Tf 50 750 Td (Section %d) Tj ET" % n for n in range(1, 6)]
+        + [b"q 100 0 0 100 0 0 cm /Im1 Do Q"]
+    ))
+    
+    extraction = extract_pdf(pdf_path)
+    
+    assert extraction.total_pages == 6
+    assert extraction.image_only_pages == [6]
+    sections = [f"Section {n}" for n in range(1, 6)]
+    assert [extraction.text.index(s) for s in sections] == sorted(extraction.text.index(s) for s in sections)
+
+
+def test_page_pool_is_shut_down(tmp_path, monkeypatch):
+    """Shutting down stops the worker pool; the next long document starts a new one."""
+    monkeypatch.setattr(text_extraction, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(text_extraction, "PDF_PAGES_PER_TASK", 2)
+    pdf_path = tmp_path / "long.pdf"
+    pdf_path.write_bytes(build_pdf([b"BT /F1 12 Tf 50 750 Td (Clause) Tj ET"] * 4))
+    
+    try:
+        extract_pdf(pdf_path)
+        pool = text_extraction._page_pool
+        assert pool is not None
+        
+        shutdown_page_pool()
+        
+        assert text_extraction._page_pool is None
+        assert extract_pdf(pdf_path).total_pages == 4
+        assert text_extraction._page_pool is not pool
+    finally:
+        shutdown_page_pool()
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_is_rolled_back_before_recording_failure(tmp_path):
+    """A statement that fails mid-extraction is rolled back before the failure is committed."""
+    pdf_path = tmp_path / "policy.pdf"
+    pdf_path.write_bytes(build_pdf([b"BT /F1 12 Tf 50 750 Td (Eligibility rules) Tj ET"]))
+    policy = SimpleNamespace(id=1, file_path=str(pdf_path), file_hash="ab" * 32)
+    record = SimpleNamespace(id=7, status=ProcessingStatus.FAILED)
+    
+    lookup = MagicMock()
+    lookup.one_or_none.return_value = (policy, record)
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.execute.side_effect = [
+        lookup,
+        OperationalError("SELECT policy_processing", {}, Exception("database is locked")),
+    ]
+    
+    with pytest.raises(TextExtractionError):
+        await process_policy_text_extraction("pol_locked", db)
+    
+    assert [name for name, _, _ in db.mock_calls if name in ("rollback", "commit")] == ["rollback", "commit"]
+    db.add.assert_called_once_with(record)
+    assert record.status == ProcessingStatus.FAILED
+    assert "database is locked" in record.error_message
+
+
 if __name__ == "__main__":
     success = test_text_extraction()
     print("\n" + "="*40)